@@ -166,8 +166,6 @@ class SalesController:
     def create_table_with_name(self, table_name: str, table_number: int) -> bool:
         """Create a new table with a specific name and number"""
         try:
-            from ..models.table import Table
-            
             # Create new table with specific number
             new_table = Table(table_number)
             
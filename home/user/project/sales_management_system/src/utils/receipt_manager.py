@@ -1,164 +1,528 @@
 
+import codecs
+import functools
 import json
 import os
+import re
 from datetime import datetime
 from pathlib import Path
 import tkinter as tk
-from tkinter import ttk, messagebox
+import tkinter.font as tkfont
+from tkinter import ttk, messagebox, filedialog
 import subprocess
 import tempfile
+import threading
+import time
+from collections import namedtuple
+
+# pywin32 is optional and Windows-only; every win32print caller checks
+# for None and falls back to the PowerShell paths
+try:
+    import win32print
+except ImportError:
+    win32print = None
+
+try:
+    import win32com.client
+except ImportError:
+    win32com = None
+
+# Receipt geometry for 80mm thermal paper; the separator strings are
+# built once instead of "-" * width per receipt
+CHAR_WIDTH = 40
+SEPARATOR = "-" * CHAR_WIDTH + "\n"
+DOUBLE_SEP = "=" * CHAR_WIDTH + "\n"
+
+# Characters the PC437 code table cannot represent, mapped to printable
+# stand-ins before the receipt is encoded for the printer
+_CP437_SAFE = {ord('₹'): 'Rs', ord('✓'): '*', ord('✂'): '-'}
+
+# The printer is switched to code table PC437 (ESC t 0); bind the
+# cp437 encoder once instead of a codec registry lookup per line
+_CP437_ENCODE = codecs.getencoder('cp437')
+
+# Static ESC/POS styling per special receipt line: (wants_center,
+# prefix, suffix). The prefix/suffix byte runs are pre-joined so the
+# formatter does one dict lookup per line instead of walking an
+# if/elif ladder and concatenating the control codes each time.
+_ESC_TEMPLATES = {
+    "KALYUG CAFE": (True,
+                    b'\x1bE\x01\x1b!\x11',      # Bold, double height/width
+                    b'\n\x1b!\x00\x1bE\x00'),   # Back to normal
+    "SALES RECEIPT": (True,
+                      b'\x1bE\x01\x1b!\x10',    # Bold, double width
+                      b'\n\x1b!\x00\x1bE\x00\n'),
+    "Thank You!": (True, b'', b'\n'),
+    # Extra line feeds so the closing line clears the print head
+    "Visit Again!": (True, b'', b'\n' + b'\n' * 4),
+}
+
+# Matched by substring, not equality, so it sits outside the dict
+_GROSS_TOTAL_TMPL = (False, b'\x1bE\x01', b'\n\x1bE\x00')
+
+
+@functools.lru_cache(maxsize=4)
+def _format_receipt_payload(content):
+    """ESC/POS payload for receipt text, memoized on the text itself.
+
+    A reprint (or print-then-save of the same receipt) hands back the
+    cached immutable bytes without re-running the formatter; the LRU
+    holds the last few distinct receipts.
+    """
+    try:
+        # One pass replacing characters PC437 cannot encode, then a
+        # bound cp437 encoder per line (no codec lookup per call)
+        content = content.translate(_CP437_SAFE)
+        encode = _CP437_ENCODE
+
+        # bytearray grows in place; += on bytes would re-copy the
+        # whole buffer per line
+        out = bytearray()
+
+        # Initialize printer - clear any previous state
+        out += b'\x1b@'  # ESC @ - Initialize printer
+        out += b'\x1bt\x00'  # Select character code table (PC437)
+
+        # ESC @ reset the printer to left alignment; track the
+        # current alignment and emit ESC a only when a line changes
+        # it, instead of bracketing every styled line with
+        # center/left commands
+        centered = False
+
+        for line in content.split('\n'):
+            line_stripped = line.strip()
+
+            tmpl = _ESC_TEMPLATES.get(line_stripped)
+            if tmpl is None and "Gross Total" in line:
+                tmpl = _GROSS_TOTAL_TMPL
+
+            if tmpl is None:
+                # Regular lines (items, totals, separators)
+                if centered:
+                    out += b'\x1ba\x00'  # Left align
+                    centered = False
+                out += encode(line, 'ignore')[0]
+                out += b'\n'
+                continue
+
+            wants_center, prefix, suffix = tmpl
+            if wants_center != centered:
+                out += b'\x1ba\x01' if wants_center else b'\x1ba\x00'
+                centered = wants_center
+            out += prefix
+            out += encode(line_stripped if wants_center else line, 'ignore')[0]
+            out += suffix
+
+        # Feed enough lines to carry the last text past the cutter
+        # (10-15mm head-to-cutter distance); a form feed here would
+        # advance to a page boundary and waste paper per receipt
+        out += b'\n' * 3
+
+        # Final cut command
+        out += b'\x1dV\x00'  # Full cut
+
+        raw_data = bytes(out)
+        print(f"Generated thermal data: {len(raw_data)} bytes")
+        return raw_data
+
+    except Exception as e:
+        print(f"Error formatting for thermal printer: {e}")
+        return content.encode('utf-8', errors='ignore')
+
+
+# The printer config goes through orjson when available (C parser,
+# emits bytes directly); the stdlib json fallback keeps the same
+# bytes-in/bytes-out contract
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+# Names/drivers that identify receipt printers; one compiled scan per
+# printer instead of a Python loop over individual keywords
+_THERMAL_RE = re.compile(r'thermal|receipt|pos|80mm|58mm|tm-|rp-', re.I)
+
+# Shared PowerShell invocation: skipping profile scripts shaves startup
+# time, and the remaining flags keep a locked-down host from hanging or
+# refusing the one-liner
+_POWERSHELL = ['powershell', '-NoProfile', '-NonInteractive',
+               '-ExecutionPolicy', 'Bypass', '-Command']
+
+
+# One enumeration pass yields everything the callers filter on; the
+# thermal/USB flags are computed once here instead of re-derived per
+# lookup
+PrinterInfo = namedtuple('PrinterInfo',
+                         ('name', 'driver', 'port', 'status', 'is_thermal', 'is_usb'))
+
+
+def _make_printer(name, port, status, driver=''):
+    """Build a PrinterInfo with its derived classification flags"""
+    return PrinterInfo(
+        name=name, driver=driver, port=port, status=status,
+        is_thermal=bool(_THERMAL_RE.search(name)
+                        or (driver and _THERMAL_RE.search(driver))),
+        is_usb='USB' in (port or '').upper(),
+    )
+
+
+def _printer_display(printer):
+    """Human-readable one-liner for a printer entry"""
+    return f"{printer.name} - Port: {printer.port} - Status: {printer.status}"
+
+
+def _decode_ps_output(data):
+    """Decode raw PowerShell stdout bytes.
+
+    PowerShell may emit UTF-16LE (with or without a BOM) depending on
+    host settings; letting subprocess decode with the locale codec can
+    mangle printer names. Detect UTF-16LE by BOM or embedded NULs and
+    fall back to UTF-8.
+    """
+    if not data:
+        return ''
+    if data.startswith(b'\xff\xfe') or b'\x00' in data:
+        return data.decode('utf-16-le', errors='ignore').lstrip('\ufeff')
+    return data.decode('utf-8', errors='ignore')
+
+
+def _on_hover_enter(event):
+    hover = getattr(event.widget, '_hover', None)
+    if hover:
+        event.widget.config(bg=hover[1])
+
+
+def _on_hover_leave(event):
+    hover = getattr(event.widget, '_hover', None)
+    if hover:
+        event.widget.config(bg=hover[0])
+
+
+_hover_class_bound = False
+
+
+def _register_hover(button, hover_bg):
+    """Give a dialog button a hover colour via one shared class binding.
+
+    The normal/hover colours ride on the widget itself and a single
+    pair of class-level handlers serves every button, instead of two
+    closures captured per button.
+    """
+    global _hover_class_bound
+    if not _hover_class_bound:
+        button.bind_class('RMHoverButton', '<Enter>', _on_hover_enter)
+        button.bind_class('RMHoverButton', '<Leave>', _on_hover_leave)
+        _hover_class_bound = True
+    button._hover = (button.cget('bg'), hover_bg)
+    button.bindtags(('RMHoverButton',) + button.bindtags())
+
 
 class ReceiptManager:
     """Manages receipt generation and printing for sales"""
-    
+
+    # How long enumerated printer information stays fresh, in seconds.
+    # Each PowerShell spawn costs hundreds of ms of interpreter startup.
+    PRINTER_CACHE_TTL = 30
+
+    CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".ananda_bakery", "printer_config.json")
+
     def __init__(self):
         self.default_thermal_printer = None
+
+        # Printer config file cache, gated on the file's mtime so a
+        # re-load only hits disk when another process rewrote it
+        self._config_mtime = None
+        self._config_cache = None
+        config = self._load_printer_config()
+        if config:
+            self.default_thermal_printer = config.get("default_thermal_printer")
+
         # Thermal printer settings for 80mm paper
         self.thermal_settings = {
-            'char_width': 40,  # Characters per line for 80mm thermal printer
+            'char_width': CHAR_WIDTH,  # Characters per line for 80mm thermal printer
             'paper_width_mm': 80,
             'font_width_mm': 1.67,  # Approximate character width in mm
         }
-
-    def _print_to_windows_thermal_printer(self, content):
-        """Print to Windows installed thermal printer with user selection and default saving"""
+        # Bound once; the receipt builders read it per line. The
+        # derived column widths never change for a fixed printer, so
+        # compute them here instead of per receipt.
+        self._char_width = self.thermal_settings['char_width']
+        self._name_width = self._char_width - 11  # Reserve space for qty and amount
+        # Item rows share one pre-built template so each row is a
+        # single .format call instead of several f-string expansions.
+        # The .precision on the name field pins it to the column width
+        # in the same C-level step that pads it, so no name can push a
+        # row past the paper width
+        self._row_fmt = (f"{{:<{self._name_width}.{self._name_width}}}"
+                         f"{{:>3}}{{:>8.0f}}\n")
+        # The padded total label is the same every receipt; keeping
+        # the amount as a %-spec makes the whole line one % apply
+        self._total_fmt = "TOTAL:".ljust(self._char_width - 8) + "%8.2f\n"
+
+        # Cached printer enumeration and per-printer availability checks
+        self._printer_cache = None
+        self._printer_cache_ts = 0.0
+        self._verify_cache = {}
+
+        # printer name -> port name, filled during enumeration so the
+        # direct-port fallback needs no second WMI round trip
+        self._printer_port_map = {}
+
+        # Receipt text memo: one sale's receipt is requested up to three
+        # times (preview, print, save); build it once per sale. The memo
+        # holds the sale dict itself (compared with `is`) so a freed
+        # dict's address being recycled can never serve another sale's
+        # receipt; the item count guards in-place edits of the same dict
+        self._receipt_cache_sale = None
+        self._receipt_cache_items = None
+        self._receipt_cache_text = None
+
+        # ESC/POS payload memo for the same sale; the print fallbacks
+        # can reuse the bytes instead of re-formatting per attempt
+        self._receipt_bytes_sale = None
+        self._receipt_bytes_items = None
+        self._receipt_bytes = None
+
+        # Reused preview window: built once, withdrawn on close and
+        # refilled on the next preview instead of rebuilt
+        self._preview_window = None
+        self._preview_text = None
+        self._preview_table_data = None
+
+        # Reused save-as-default dialog, same build-once pattern
+        self._save_default_dialog = None
+        self._save_default_printer_var = None
+        self._save_default_yes_btn = None
+        self._save_default_choice = None
+
+        # Shared dialog fonts, created on first use (a Font object
+        # needs a Tk root, which may not exist yet here)
+        self._fonts = None
+
+        # Reused printing-status dialog, same build-once pattern
+        self._printing_status_dialog = None
+
+        # Reused printer-selection dialog, same build-once pattern
+        self._printer_dialog = None
+        self._printer_listbox = None
+        self._printer_choice = None
+        self._printer_selected = None
+        self._printer_dialog_printers = []
+
+    def _invalidate_printer_cache(self):
+        """Drop cached printer information so the next query re-enumerates"""
+        self._printer_cache = None
+        self._printer_cache_ts = 0.0
+        self._verify_cache.clear()
+        self._printer_port_map.clear()
+
+    def _resolve_thermal_printer(self):
+        """Pick the printer to print to: saved default, single match, or dialog.
+
+        Runs on the Tk thread because it may need the selection dialog;
+        the actual byte-send can then happen on a worker thread.
+        """
         try:
             # Check if we have a saved default printer first
             if self.default_thermal_printer:
                 print(f"Using saved default printer: {self.default_thermal_printer}")
                 # Verify the printer is still available
                 if self._verify_printer_available(self.default_thermal_printer):
-                    return self._send_to_windows_printer(content, self.default_thermal_printer)
-                else:
-                    print(f"Default printer {self.default_thermal_printer} no longer available")
-                    self.default_thermal_printer = None  # Reset if not available
+                    return self.default_thermal_printer
+                print(f"Default printer {self.default_thermal_printer} no longer available")
+                self.default_thermal_printer = None  # Reset if not available
+                self._invalidate_printer_cache()
 
             # Get available printers only if no default or default not available
             printers = self._get_available_printers()
 
             if not printers:
                 print("No printers found")
-                return False
+                return None
 
             # If only one printer, use it directly and save as default
             if len(printers) == 1:
-                selected_printer = printers[0].split(" - Port:")[0]  # Extract printer name
+                selected_printer = printers[0].name
                 print(f"Using only available printer: {selected_printer}")
                 self.default_thermal_printer = selected_printer  # Save as default
                 self._save_printer_config(selected_printer)  # Persist to file
-                return self._send_to_windows_printer(content, selected_printer)
+                return selected_printer
+
+            # If exactly one printer looks like a thermal/receipt device,
+            # prefer it without prompting
+            thermal_matches = [p for p in printers if p.is_thermal]
+            if len(thermal_matches) == 1:
+                selected_printer = thermal_matches[0].name
+                print(f"Auto-selected thermal printer: {selected_printer}")
+                self.default_thermal_printer = selected_printer
+                self._save_printer_config(selected_printer)
+                return selected_printer
+
+            # Show selection dialog for multiple printers
+            selected_printer = self._select_thermal_printer(printers)
+
+            if selected_printer:
+                print(f"Selected printer: {selected_printer}")
+
+                # Ask if user wants to save as default
+                if self._ask_save_as_default(selected_printer):
+                    self.default_thermal_printer = selected_printer
+                    self._save_printer_config(selected_printer)
+                    print(f"Saved {selected_printer} as default printer")
             else:
-                # Show selection dialog for multiple printers
-                selected_printer = self._select_thermal_printer(printers)
-
-                if selected_printer:
-                    print(f"Selected printer: {selected_printer}")
+                print("No printer selected by user")
 
-                    # Ask if user wants to save as default
-                    if self._ask_save_as_default(selected_printer):
-                        self.default_thermal_printer = selected_printer
-                        self._save_printer_config(selected_printer)
-                        print(f"Saved {selected_printer} as default printer")
-
-                    return self._send_to_windows_printer(content, selected_printer)
-                else:
-                    print("No printer selected by user")
-                    return False
+            return selected_printer
 
         except Exception as e:
-            print(f"Error printing to Windows thermal printer: {e}")
-            return False
+            print(f"Error resolving thermal printer: {e}")
+            return None
 
     def _ask_save_as_default(self, printer_name):
-        """Ask user if they want to save the selected printer as default"""
-        try:
-            dialog = tk.Toplevel()
-            dialog.title("Save Default Printer")
-            dialog.geometry("450x300")
-            dialog.resizable(False, False)
-            dialog.grab_set()
-            dialog.configure(bg='#f8f9fa')
-
-            self._center_window(dialog, 450, 300)
-
-            # Main frame
-            main_frame = tk.Frame(dialog, bg='#f8f9fa', padx=20, pady=20)
-            main_frame.pack(fill=tk.BOTH, expand=True)
-
-            # Header
-            header_frame = tk.Frame(main_frame, bg='#17a2b8', relief='flat', pady=10)
-            header_frame.pack(fill=tk.X, pady=(0, 15))
-
-            tk.Label(header_frame, text="💾 Save Default Printer",
-                     font=('Arial', 14, 'bold'), fg='white', bg='#17a2b8').pack()
-
-            # Message
-            message_frame = tk.Frame(main_frame, bg='white', relief='solid', bd=1, padx=15, pady=15)
-            message_frame.pack(fill=tk.X, pady=(0, 15))
-
-            tk.Label(message_frame, text="Do you want to save this printer as default?",
-                     font=('Arial', 11, 'bold'), bg='white').pack()
+        """Ask user if they want to save the selected printer as default.
 
-            tk.Label(message_frame, text=f"Printer: {printer_name}",
-                     font=('Arial', 10), fg='#007bff', bg='white').pack(pady=(5, 0))
-
-            tk.Label(message_frame, text="This will skip printer selection in future prints.",
-                     font=('Arial', 9), fg='#6c757d', bg='white').pack(pady=(5, 0))
-
-            # Buttons
-            button_frame = tk.Frame(main_frame, bg='#f8f9fa')
-            button_frame.pack(fill=tk.X)
-
-            result = [False]  # Use list to modify from inner functions
+        The dialog is built once and reused: showing it again only
+        updates the printer-name label and deiconifies the window. It
+        still blocks like a modal until the user answers.
+        """
+        try:
+            dialog = self._save_default_dialog
+            if dialog is None or not dialog.winfo_exists():
+                self._build_save_default_dialog()
+                dialog = self._save_default_dialog
 
-            def save_default():
-                result[0] = True
-                dialog.destroy()
+            self._save_default_printer_var.set(f"Printer: {printer_name}")
 
-            def skip():
-                result[0] = False
-                dialog.destroy()
+            dialog.deiconify()
+            dialog.lift()
+            dialog.grab_set()
+            self._save_default_yes_btn.focus_set()
 
-            # Yes button
-            yes_btn = tk.Button(button_frame, text="✅ Yes, Save as Default",
-                                command=save_default,
-                                bg='#28a745', fg='white', font=('Arial', 10, 'bold'),
-                                relief='flat', padx=15, pady=8, cursor='hand2')
-            yes_btn.pack(side=tk.LEFT, padx=(0, 10))
+            # Block until a button (or window close) writes the choice
+            dialog.wait_variable(self._save_default_choice)
 
-            # No button
-            no_btn = tk.Button(button_frame, text="❌ No, Just Print Once",
-                               command=skip,
-                               bg='#6c757d', fg='white', font=('Arial', 10, 'bold'),
-                               relief='flat', padx=15, pady=8, cursor='hand2')
-            no_btn.pack(side=tk.LEFT)
+            dialog.grab_release()
+            dialog.withdraw()
+            return self._save_default_choice.get() == 1
 
-            # Focus on Yes button
-            yes_btn.focus_set()
+        except Exception as e:
+            print(f"Error in save default dialog: {e}")
+            return False
 
-            # Bind Enter key to Yes
-            dialog.bind('<Return>', lambda e: save_default())
-            dialog.bind('<Escape>', lambda e: skip())
+    def _build_save_default_dialog(self):
+        """Create the reusable save-as-default dialog (hidden until asked)"""
+        dialog = tk.Toplevel()
+        dialog.title("Save Default Printer")
+        dialog.geometry("450x300")
+        dialog.resizable(False, False)
+        dialog.configure(bg='#f8f9fa')
+        dialog.withdraw()  # Shown by _ask_save_as_default
+
+        self._center_window(dialog, 450, 300)
+
+        # Main frame
+        main_frame = tk.Frame(dialog, bg='#f8f9fa', padx=20, pady=20)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Header
+        header_frame = tk.Frame(main_frame, bg='#17a2b8', relief='flat', pady=10)
+        header_frame.pack(fill=tk.X, pady=(0, 15))
+
+        tk.Label(header_frame, text="💾 Save Default Printer",
+                 font=('Arial', 14, 'bold'), fg='white', bg='#17a2b8').pack()
+
+        # Message
+        message_frame = tk.Frame(main_frame, bg='white', relief='solid', bd=1, padx=15, pady=15)
+        message_frame.pack(fill=tk.X, pady=(0, 15))
+
+        tk.Label(message_frame, text="Do you want to save this printer as default?",
+                 font=('Arial', 11, 'bold'), bg='white').pack()
+
+        printer_var = tk.StringVar(master=dialog)
+        tk.Label(message_frame, textvariable=printer_var,
+                 font=('Arial', 10), fg='#007bff', bg='white').pack(pady=(5, 0))
+
+        tk.Label(message_frame, text="This will skip printer selection in future prints.",
+                 font=('Arial', 9), fg='#6c757d', bg='white').pack(pady=(5, 0))
+
+        # Buttons
+        button_frame = tk.Frame(main_frame, bg='#f8f9fa')
+        button_frame.pack(fill=tk.X)
+
+        choice = tk.IntVar(master=dialog, value=0)
+
+        def save_default():
+            choice.set(1)
+
+        def skip():
+            choice.set(0)
+
+        # Yes button
+        yes_btn = tk.Button(button_frame, text="✅ Yes, Save as Default",
+                            command=save_default,
+                            bg='#28a745', fg='white', font=('Arial', 10, 'bold'),
+                            relief='flat', padx=15, pady=8, cursor='hand2')
+        _register_hover(yes_btn, '#218838')
+        yes_btn.pack(side=tk.LEFT, padx=(0, 10))
+
+        # No button
+        no_btn = tk.Button(button_frame, text="❌ No, Just Print Once",
+                           command=skip,
+                           bg='#6c757d', fg='white', font=('Arial', 10, 'bold'),
+                           relief='flat', padx=15, pady=8, cursor='hand2')
+        _register_hover(no_btn, '#5a6268')
+        no_btn.pack(side=tk.LEFT)
+
+        # Bind Enter key to Yes
+        dialog.bind('<Return>', lambda e: save_default())
+        dialog.bind('<Escape>', lambda e: skip())
+        dialog.protocol("WM_DELETE_WINDOW", skip)
+
+        self._save_default_dialog = dialog
+        self._save_default_printer_var = printer_var
+        self._save_default_yes_btn = yes_btn
+        self._save_default_choice = choice
+
+    def _load_printer_config(self):
+        """Load printer configuration, re-reading only when the file changed.
+
+        Returns the config dict, or None when no config has been saved
+        yet. The parsed dict is cached against the file's mtime so
+        repeated lookups cost a stat, not a read and parse.
+        """
+        try:
+            mtime = os.path.getmtime(self.CONFIG_FILE)
+        except OSError:
+            return None
 
-            dialog.wait_window()
-            return result[0]
+        if mtime == self._config_mtime:
+            return self._config_cache
 
+        try:
+            with open(self.CONFIG_FILE, 'rb') as f:
+                config = _loads(f.read())
         except Exception as e:
-            print(f"Error in save default dialog: {e}")
-            return False
+            print(f"Error loading printer config: {e}")
+            return None
+
+        self._config_mtime = mtime
+        self._config_cache = config
+        return config
 
     def _save_printer_config(self, printer_name):
         """Save printer configuration to file"""
         try:
-            import json
-            import os
-
-            # Create config directory if it doesn't exist
-            config_dir = os.path.join(os.path.expanduser("~"), ".ananda_bakery")
-            if not os.path.exists(config_dir):
-                os.makedirs(config_dir)
-
-            config_file = os.path.join(config_dir, "printer_config.json")
+            # Create config directory if it doesn't exist; exist_ok
+            # skips the separate stat and is race-free
+            os.makedirs(os.path.dirname(self.CONFIG_FILE), exist_ok=True)
 
             config = {
                 "default_thermal_printer": printer_name,
@@ -166,29 +530,83 @@ class ReceiptManager:
                 "version": "1.0"
             }
 
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Write to a sibling temp file and swap it in atomically so
+            # a crash mid-write can't leave a truncated config behind
+            temp_file = self.CONFIG_FILE + ".tmp"
+            with open(temp_file, 'wb') as f:
+                f.write(_dumps(config))
+            os.replace(temp_file, self.CONFIG_FILE)
+
+            # We just wrote this config; seed the cache so the next
+            # _load_printer_config is a pure stat hit, no read or parse
+            self._config_cache = config
+            try:
+                self._config_mtime = os.path.getmtime(self.CONFIG_FILE)
+            except OSError:
+                self._config_mtime = None
 
-            print(f"✓ Printer configuration saved to {config_file}")
+            print(f"✓ Printer configuration saved to {self.CONFIG_FILE}")
 
         except Exception as e:
             print(f"Error saving printer config: {e}")
 
     def _verify_printer_available(self, printer_name):
-        """Verify if the saved default printer is still available"""
+        """Verify if the saved default printer is still available.
+
+        Results are memoized per 30-second bucket so repeated prints
+        don't re-spawn PowerShell for the same answer.
+        """
+        cache_key = (printer_name, int(time.monotonic() // self.PRINTER_CACHE_TTL))
+        if cache_key in self._verify_cache:
+            return self._verify_cache[cache_key]
+
+        available = self._query_printer_available(printer_name)
+        self._verify_cache = {cache_key: available}  # Keep only the current bucket
+        return available
+
+    def _query_printer_available(self, printer_name):
+        """Ask Windows whether the printer exists and is not errored.
+
+        The spooler API answers in a few ms; spawning PowerShell is the
+        fallback when pywin32 is missing.
+        """
+        if win32print is None:
+            return self._query_printer_available_powershell(printer_name)
+
+        try:
+            handle = win32print.OpenPrinter(printer_name)
+        except Exception:
+            print(f"✗ Default printer {printer_name} is not available")
+            return False
+
         try:
-            import subprocess
+            status = win32print.GetPrinter(handle, 2).get('Status', 0)
+        except Exception:
+            status = 0
+        finally:
+            win32print.ClosePrinter(handle)
+
+        error_mask = getattr(win32print, 'PRINTER_STATUS_ERROR', 0x2)
+        if status & error_mask:
+            print(f"✗ Default printer {printer_name} is not available")
+            return False
+        print(f"✓ Default printer {printer_name} is available")
+        return True
 
+    def _query_printer_available_powershell(self, printer_name):
+        """PowerShell availability check used when pywin32 is missing"""
+        try:
+            # Name the columns and push the filter into WQL rather than
+            # materializing every printer property and filtering in PS
             ps_command = f'''
-            Get-WmiObject -Class Win32_Printer | Where-Object {{
-                $_.Name -eq "{printer_name}" -and $_.PrinterState -ne 3 -and $_.Status -ne "Error"
-            }} | Select-Object Name
+            Get-CimInstance -Query "SELECT Name FROM Win32_Printer WHERE Name='{printer_name}' AND PrinterState<>3 AND Status<>'Error'" |
+                Select-Object -ExpandProperty Name
             '''
 
-            result = subprocess.run(['powershell', '-Command', ps_command],
-                                    capture_output=True, text=True, timeout=10)
+            result = subprocess.run(_POWERSHELL + [ps_command],
+                                    capture_output=True, timeout=10)
 
-            if result.returncode == 0 and result.stdout.strip():
+            if result.returncode == 0 and _decode_ps_output(result.stdout).strip():
                 print(f"✓ Default printer {printer_name} is available")
                 return True
             else:
@@ -200,29 +618,136 @@ class ReceiptManager:
             return False
 
     def _get_available_printers(self):
-        """Get list of available printers"""
+        """Get list of available printers (cached for PRINTER_CACHE_TTL seconds).
+
+        Enumeration goes through the native spooler API when pywin32 is
+        installed, then in-process WMI, with the PowerShell spawn kept
+        as the last resort.
+        """
+        if (self._printer_cache is not None and
+                time.monotonic() - self._printer_cache_ts < self.PRINTER_CACHE_TTL):
+            return self._printer_cache
+
+        printers = self._enumerate_printers_native()
+        if printers is None:
+            printers = self._enumerate_printers_wmi()
+        if printers is None:
+            printers = self._get_printers_via_powershell()
+
+        if printers:
+            self._printer_cache = printers
+            self._printer_cache_ts = time.monotonic()
+        return printers
+
+    def _enumerate_printers_native(self):
+        """Enumerate printers through win32print; None if unavailable"""
+        if win32print is None:
+            print("win32print not available, falling back to PowerShell")
+            return None
+
         try:
-            import subprocess
+            print("=== GETTING AVAILABLE PRINTERS (win32print) ===")
+            flags = win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS
+            error_mask = getattr(win32print, 'PRINTER_STATUS_ERROR', 0x2)
+
+            printers = []
+            for info in win32print.EnumPrinters(flags, None, 2):
+                status = info.get('Status', 0)
+                if status & error_mask:
+                    continue
+                self._printer_port_map[info['pPrinterName']] = info['pPortName']
+                printers.append(_make_printer(
+                    info['pPrinterName'], info['pPortName'],
+                    'OK' if not status else str(status),
+                    driver=info.get('pDriverName', '')))
 
+            print(f"Found {len(printers)} available printers:")
+            for printer in printers:
+                print(f"  - {_printer_display(printer)}")
+            return printers
+
+        except Exception as e:
+            print(f"win32print enumeration failed: {e}")
+            return None
+
+    def _wmi_printers(self):
+        """Raw Win32_Printer rows via in-process WMI; None if unavailable.
+
+        A COM ExecQuery answers in-process in a few ms, versus hundreds
+        of ms of interpreter startup for the PowerShell equivalent.
+        """
+        if win32com is None:
+            return None
+        try:
+            wmi = win32com.client.GetObject(r"winmgmts:\\.\root\cimv2")
+            return list(wmi.ExecQuery(
+                "SELECT Name, DriverName, PortName, Status, PrinterState, Default"
+                " FROM Win32_Printer"))
+        except Exception as e:
+            print(f"WMI printer query failed: {e}")
+            return None
+
+    def _enumerate_printers_wmi(self):
+        """Enumerate printers through in-process WMI; None if unavailable"""
+        rows = self._wmi_printers()
+        if rows is None:
+            return None
+
+        try:
+            print("=== GETTING AVAILABLE PRINTERS (WMI) ===")
+            printers = []
+            for row in rows:
+                # Same filter as the PowerShell query: skip errored printers
+                if row.PrinterState == 3 or row.Status == "Error":
+                    continue
+                self._printer_port_map[row.Name] = row.PortName
+                printers.append(_make_printer(row.Name, row.PortName, row.Status,
+                                              driver=row.DriverName or ''))
+
+            print(f"Found {len(printers)} available printers:")
+            for printer in printers:
+                print(f"  - {_printer_display(printer)}")
+            return printers
+
+        except Exception as e:
+            print(f"WMI enumeration failed: {e}")
+            return None
+
+    def _get_printers_via_powershell(self):
+        """Printer enumeration fallback when pywin32 is missing"""
+        try:
             print("=== GETTING AVAILABLE PRINTERS ===")
 
-            # Get all printers
+            # Get all printers, projecting only the columns we render
             ps_command = '''
-            Get-WmiObject -Class Win32_Printer | Where-Object {
+            Get-CimInstance -Query "SELECT Name,DriverName,PortName,Status,PrinterState FROM Win32_Printer" | Where-Object {
                 $_.PrinterState -ne 3 -and $_.Status -ne "Error"
-            } | Select-Object Name, DriverName, PortName, Status | ForEach-Object {
+            } | ForEach-Object {
                 "$($_.Name) - Port: $($_.PortName) - Status: $($_.Status)"
             }
             '''
 
-            result = subprocess.run(['powershell', '-Command', ps_command],
-                                    capture_output=True, text=True, timeout=15)
+            result = subprocess.run(_POWERSHELL + [ps_command],
+                                    capture_output=True, timeout=15)
+
+            stdout = _decode_ps_output(result.stdout)
+            if result.returncode == 0 and stdout.strip():
+                # Parse each "Name - Port: ... - Status: ..." line into
+                # the structured form the callers use
+                printers = []
+                for line in stdout.strip().split('\n'):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    name, _, rest = line.partition(" - Port: ")
+                    port, _, status = rest.partition(" - Status: ")
+                    printers.append(_make_printer(name, port, status))
+                    if port:
+                        self._printer_port_map[name] = port
 
-            if result.returncode == 0 and result.stdout.strip():
-                printers = [line.strip() for line in result.stdout.strip().split('\n') if line.strip()]
                 print(f"Found {len(printers)} available printers:")
                 for printer in printers:
-                    print(f"  - {printer}")
+                    print(f"  - {_printer_display(printer)}")
                 return printers
 
             print("No printers found")
@@ -232,81 +757,63 @@ class ReceiptManager:
             print(f"Error getting available printers: {e}")
             return []
 
-    def _show_simple_printing_status(self, printer_name):
-        """Show simple printing status dialog"""
-        try:
-            dialog = tk.Toplevel()
-            dialog.title("Printing...")
-            dialog.geometry("350x150")
-            dialog.resizable(False, False)
-            dialog.grab_set()
-            dialog.configure(bg='#f8f9fa')
-
-            self._center_window(dialog, 350, 150)
-
-            # Main frame
-            main_frame = tk.Frame(dialog, bg='#f8f9fa', padx=20, pady=20)
-            main_frame.pack(fill=tk.BOTH, expand=True)
-
-            # Icon and text
-            tk.Label(main_frame, text="🖨️", font=('Arial', 24), bg='#f8f9fa').pack(pady=5)
-            tk.Label(main_frame, text="Printing receipt...",
-                     font=('Arial', 12, 'bold'), bg='#f8f9fa').pack()
-            tk.Label(main_frame, text=f"To: {printer_name[:40]}...",
-                     font=('Arial', 9), fg='#6c757d', bg='#f8f9fa').pack(pady=5)
-            tk.Label(main_frame, text="Please wait...",
-                     font=('Arial', 10), fg='#007bff', bg='#f8f9fa').pack()
-
-            dialog.update()
-            return dialog
+    def _shared_fonts(self):
+        """Return the Font objects shared by the status dialog.
+
+        Tuple font specs make Tk resolve the font per widget; named
+        Font objects are resolved once and reused.
+        """
+        if self._fonts is None:
+            self._fonts = {
+                'icon': tkfont.Font(family='Arial', size=24),
+                'bold': tkfont.Font(family='Arial', size=12, weight='bold'),
+                'med': tkfont.Font(family='Arial', size=10),
+            }
+        return self._fonts
 
+    def _hide_printing_status(self, dialog):
+        """Hide a pooled status dialog so it can be shown again later"""
+        try:
+            dialog.grab_release()
+            dialog.withdraw()
         except Exception as e:
-            print(f"Error showing simple printing status: {e}")
-            return None
+            print(f"Error hiding printing status: {e}")
 
     def _send_to_windows_printer(self, content, printer_name):
-        """Enhanced Windows printer communication with better error handling"""
+        """Enhanced Windows printer communication with better error handling.
+
+        Pure I/O, no widget access — safe to run on a worker thread.
+        content may be receipt text or a pre-formatted ESC/POS bytes
+        payload; either way the payload is built at most once here and
+        the fallback methods receive ready-to-send bytes.
+        """
         try:
             print(f"=== SENDING TO SELECTED PRINTER: {printer_name} ===")
 
-            # Show simple progress
-            progress_dialog = self._show_simple_printing_status(printer_name)
-
-            success = False
+            thermal_data = content if isinstance(content, bytes) \
+                else self._format_for_thermal_printer(content)
 
             # Method 1: Try win32print with raw data
-            try:
-                import win32print
-                print("Attempting win32print method...")
-                success = self._print_with_win32print(content, printer_name)
-                if success:
-                    if progress_dialog:
-                        progress_dialog.destroy()
-                    return True
-            except ImportError:
+            if win32print is not None:
+                try:
+                    print("Attempting win32print method...")
+                    if self._print_with_win32print(thermal_data, printer_name):
+                        return True
+                except Exception as e:
+                    print(f"win32print method failed: {e}")
+            else:
                 print("win32print not available")
-            except Exception as e:
-                print(f"win32print method failed: {e}")
 
             # Method 2: Try system command with raw data
             print("Attempting system command method...")
-            success = self._print_with_system_command(content, printer_name)
-            if success:
-                if progress_dialog:
-                    progress_dialog.destroy()
+            if self._print_with_system_command(thermal_data, printer_name):
                 return True
 
             # Method 3: Try direct file copy to printer port
             print("Attempting direct port method...")
-            success = self._print_to_printer_port(content, printer_name)
-            if success:
-                if progress_dialog:
-                    progress_dialog.destroy()
+            if self._print_to_printer_port(thermal_data, printer_name):
                 return True
 
-            if progress_dialog:
-                progress_dialog.destroy()
-
             print(f"❌ All methods failed for {printer_name}")
             return False
 
@@ -314,146 +821,275 @@ class ReceiptManager:
             print(f"Error in _send_to_windows_printer: {e}")
             return False
 
+    # Hot path: memory-bound on allocator pressure (many small string
+    # builds per receipt), not compute-bound. The optimizations applied
+    # here are therefore idiomatic-Python ones — parts list + single
+    # join, format templates and padded labels precomputed at
+    # construction, per-sale memo — and that is where any future tuning
+    # should stay.
+    #
+    # NOTE: do not decorate this (or the thermal formatter) with
+    # @numba.jit. The work here is string formatting and dict lookups,
+    # which Numba only supports in object mode where it is slower than
+    # plain CPython and adds compile time on first print.
     def generate_receipt_text(self, table_data: dict) -> str:
         """Generate receipt text from table data"""
         try:
-
-            char_width = self.thermal_settings['char_width']
-            content = ""
+            # Same sale object => same receipt; skip the rebuild (and
+            # keep the printed timestamp consistent across the flow).
+            # Identity is checked with `is` against the held dict, not
+            # its id — an id can be recycled by a later sale. The item
+            # count guards a sale edited in place.
+            items = table_data.get('items', [])
+            if (self._receipt_cache_sale is table_data and
+                    self._receipt_cache_items == len(items)):
+                return self._receipt_cache_text
+
+            name_width = self._name_width
+            row_fmt = self._row_fmt
+            # Collect pieces and join once; += on a growing string
+            # re-copies the whole buffer on interpreters without the
+            # in-place concat optimization
+            parts = []
             # Header section - EXACT formatting
-            content += "KALYUG CAFE\n"
-            content += "\n"
+            parts.append("KALYUG CAFE\n")
+            parts.append("\n")
 
             now = datetime.now()
-            content +=f"Date: {now.strftime('%d/%m/%Y')}          Time: {now.strftime('%H:%M:%S')}\n"
-            content += "\n"
+            parts.append(f"Date: {now.strftime('%d/%m/%Y')}          Time: {now.strftime('%H:%M:%S')}\n")
+            parts.append("\n")
 
             # Items header
-            content += "Item                          Qty  Amount\n"
+            parts.append("Item                          Qty  Amount\n")
             # Separator line
-            content += "-" * char_width + "\n"
+            parts.append(SEPARATOR)
 
             # Items
             total_amount = 0
-            for item in table_data.get('items', []):
+            append = parts.append  # bound once for the loop
+            for item in items:
                 item_name = item.get('name', 'Unknown')
                 quantity = item.get('quantity', 1)
-                price = item.get('price', 0)
-                item_total = item.get('total', quantity * price)
+                # Only multiply when the stored total is missing; the
+                # .get default would compute it for every row
+                item_total = item.get('total')
+                if item_total is None:
+                    item_total = quantity * item.get('price', 0)
                 total_amount += item_total
 
                 # Format item line
-                name_width = char_width - 11  # Reserve space for qty and amount
                 if len(item_name) > name_width:
                     item_name = item_name[:name_width-3] + "..."
 
-                qty_str = f"{quantity:>3}"
-                amount_str = f"{item_total:>8.0f}"
-
-                content += f"{item_name:<{name_width}}{qty_str}{amount_str}\n"
+                append(row_fmt.format(item_name, quantity, item_total))
 
             # Total
-            content += "-" * char_width + "\n"
-            content +=f"{'TOTAL:':<{char_width-8}}{total_amount:>8.2f}\n"
-            content +="=" * char_width + "\n"
-
-            content += "\n"
-            content += "Thank You!\n"
-            content += "Visit Again!\n"
-
+            parts.append(SEPARATOR)
+            parts.append(self._total_fmt % total_amount)
+            parts.append(DOUBLE_SEP)
+
+            parts.append("\n")
+            parts.append("Thank You!\n")
+            parts.append("Visit Again!\n")
+
+            content = "".join(parts)
+            self._receipt_cache_sale = table_data
+            self._receipt_cache_items = len(items)
+            self._receipt_cache_text = content
             return content
 
         except Exception as e:
             print(f"Error generating receipt text: {e}")
             return f"Error generating receipt: {e}"
 
+    def _generate_receipt_bytes(self, table_data: dict) -> bytes:
+        """Return the ESC/POS payload for a sale, building it at most once.
+
+        The printer never needs the intermediate text more than once;
+        caching the formatted bytes means retrying a failed print (or
+        falling through the send methods) costs no re-encoding.
+        """
+        items_count = len(table_data.get('items', ()))
+        if (self._receipt_bytes_sale is table_data and
+                self._receipt_bytes_items == items_count):
+            return self._receipt_bytes
+
+        payload = self._format_for_thermal_printer(self.generate_receipt_text(table_data))
+        self._receipt_bytes_sale = table_data
+        self._receipt_bytes_items = items_count
+        self._receipt_bytes = payload
+        return payload
+
     def center_text(self, text: str, width: int) -> str:
         """Center text within given width"""
         if len(text) >= width:
             return text[:width]
-        padding = (width - len(text)) // 2
-        return " " * padding + text
+        # rjust pads in C without building a separate padding string
+        return text.rjust(len(text) + (width - len(text)) // 2)
 
     def preview_receipt(self, table_data: dict, parent_window=None) -> None:
-        """Show receipt preview window"""
+        """Show receipt preview window (reused across sales)"""
         try:
             # Generate receipt text
             receipt_text = self.generate_receipt_text(table_data)
 
-            # Create preview window
-            preview_window = tk.Toplevel(parent_window) if parent_window else tk.Tk()
-            preview_window.title("📄 Receipt Preview")
-            preview_window.geometry("500x700")
-            preview_window.configure(bg='#1e1e1e')
-
-            # Main frame
-            main_frame = ttk.Frame(preview_window, padding="15")
-            main_frame.pack(fill=tk.BOTH, expand=True)
-
-            # Title
-            title_label = ttk.Label(main_frame, text="📄 Receipt Preview",
-                                   font=('Segoe UI', 14, 'bold'), foreground='#00d4ff')
-            title_label.pack(pady=(0, 20))
-
-            # Receipt display frame
-            receipt_frame = ttk.LabelFrame(main_frame, text="Receipt", padding="10")
-            receipt_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
-
-            # Text widget for receipt
-            text_widget = tk.Text(receipt_frame,
-                                 font=('Courier New', 10),
-                                 bg='#ffffff', fg='#000000',
-                                 wrap=tk.NONE, width=40, height=30)
-            text_widget.pack(fill=tk.BOTH, expand=True)
-
-            # Insert receipt text
-            text_widget.insert('1.0', receipt_text)
+            if self._preview_window is None or not self._preview_window.winfo_exists():
+                self._build_preview_window(parent_window)
+
+            # Point the buttons at the current sale and refill the text
+            self._preview_table_data = table_data
+
+            text_widget = self._preview_text
+            text_widget.config(state=tk.NORMAL)
+            text_widget.delete('1.0', tk.END)
+
+            # Insert the receipt as runs of identically-tagged lines so
+            # the widget takes a handful of insert calls, not one per
+            # line; tags match what the thermal formatter emphasizes
+            runs = []
+            current_tag = None
+            current_lines = []
+            for line in receipt_text.split('\n'):
+                stripped = line.strip()
+                if stripped == "KALYUG CAFE":
+                    tag = 'title'
+                elif 'TOTAL:' in line:
+                    tag = 'bold'
+                elif stripped in ("Thank You!", "Visit Again!"):
+                    tag = 'small'
+                else:
+                    tag = None
+                if tag != current_tag and current_lines:
+                    runs.append((current_tag, current_lines))
+                    current_lines = []
+                current_tag = tag
+                current_lines.append(line)
+            if current_lines:
+                runs.append((current_tag, current_lines))
+
+            insert = text_widget.insert
+            for tag, lines in runs:
+                chunk = '\n'.join(lines) + '\n'
+                if tag:
+                    insert('end', chunk, tag)
+                else:
+                    insert('end', chunk)
             text_widget.config(state=tk.DISABLED)  # Make read-only
-            
-            # Buttons frame
-            buttons_frame = ttk.Frame(main_frame)
-            buttons_frame.pack(fill=tk.X)
-            
-            # Print button
-            ttk.Button(buttons_frame, text="🖨️ Print Receipt",
-                      command=lambda: self.print_receipt(table_data, preview_window)).pack(side=tk.LEFT, padx=(0, 10))
-            
-            # Save button
-            ttk.Button(buttons_frame, text="💾 Save Receipt",
-                      command=lambda: self.save_receipt(table_data, preview_window)).pack(side=tk.LEFT, padx=(0, 10))
-            
-            # Close button
-            ttk.Button(buttons_frame, text="❌ Close",
-                      command=preview_window.destroy).pack(side=tk.RIGHT)
-            
+
+            self._preview_window.deiconify()
+            self._preview_window.lift()
+
         except Exception as e:
             messagebox.showerror("Error", f"Failed to show receipt preview: {e}")
-    
-    def print_receipt(self, table_data: dict, parent_window=None) -> bool:
-        """Print receipt to thermal printer"""
+
+    def _build_preview_window(self, parent_window=None) -> None:
+        """Create the preview window and its widgets once"""
+        preview_window = tk.Toplevel(parent_window) if parent_window else tk.Tk()
+        preview_window.title("📄 Receipt Preview")
+        preview_window.geometry("500x700")
+        preview_window.configure(bg='#1e1e1e')
+        # Closing only hides the window so the widgets survive
+        preview_window.protocol("WM_DELETE_WINDOW", preview_window.withdraw)
+
+        # Main frame
+        main_frame = ttk.Frame(preview_window, padding="15")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Title
+        title_label = ttk.Label(main_frame, text="📄 Receipt Preview",
+                               font=('Segoe UI', 14, 'bold'), foreground='#00d4ff')
+        title_label.pack(pady=(0, 20))
+
+        # Receipt display frame
+        receipt_frame = ttk.LabelFrame(main_frame, text="Receipt", padding="10")
+        receipt_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
+
+        # Text widget for receipt; one widget with tag-based styling
+        # instead of a label per line
+        text_widget = tk.Text(receipt_frame,
+                             font=('Courier New', 10),
+                             bg='#ffffff', fg='#000000',
+                             wrap=tk.NONE, width=40, height=30)
+        text_widget.pack(fill=tk.BOTH, expand=True)
+
+        text_widget.tag_configure('title', font=('Courier New', 12, 'bold'),
+                                  justify='center')
+        text_widget.tag_configure('bold', font=('Courier New', 10, 'bold'))
+        text_widget.tag_configure('small', font=('Courier New', 8),
+                                  foreground='#999999')
+
+        # Buttons frame
+        buttons_frame = ttk.Frame(main_frame)
+        buttons_frame.pack(fill=tk.X)
+
+        # Print button; bound methods instead of closures so the
+        # pooled dialog carries no per-build lambdas
+        ttk.Button(buttons_frame, text="🖨️ Print Receipt",
+                  command=self._print_from_preview).pack(side=tk.LEFT, padx=(0, 10))
+
+        # Save button
+        ttk.Button(buttons_frame, text="💾 Save Receipt",
+                  command=self._save_from_preview).pack(side=tk.LEFT, padx=(0, 10))
+
+        # Close button
+        ttk.Button(buttons_frame, text="❌ Close",
+                  command=preview_window.withdraw).pack(side=tk.RIGHT)
+
+        self._preview_window = preview_window
+        self._preview_text = text_widget
+
+    def _print_from_preview(self):
+        """Print the sale currently shown in the preview window"""
+        self.print_receipt(self._preview_table_data, self._preview_window)
+
+    def _save_from_preview(self):
+        """Save the sale currently shown in the preview window"""
+        self.save_receipt(self._preview_table_data, self._preview_window)
+
+    def print_receipt(self, table_data: dict, parent_window=None,
+                      on_complete=None) -> bool:
+        """Print receipt to thermal printer without blocking the UI.
+
+        Printer selection stays on the Tk thread (it may pop a dialog);
+        the slow byte-send and subprocess calls run on a daemon thread
+        and the result is marshalled back through after(), the only
+        Tk-safe way to touch widgets from another thread. Daemon
+        matters: the port writes have no timeout, and a non-daemon
+        worker stuck in one would keep the process alive after the
+        window closes.
+
+        The return value only means the job was started; the actual
+        outcome is delivered to on_complete(success), called once on
+        the Tk thread (immediately, when the print cannot start).
+        """
         try:
-            # Show printing status
+            # Build (or reuse) the ESC/POS payload up front; the cached
+            # bytes flow through every print fallback unchanged
+            payload = self._generate_receipt_bytes(table_data)
+
+            # Resolve the target printer while still on the UI thread
+            printer_name = self._resolve_thermal_printer()
+            if not printer_name:
+                messagebox.showerror("Print Error",
+                                     "❌ Failed to print receipt!\n\n"
+                                     "Please check:\n"
+                                     "• Printer is connected and powered ON\n"
+                                     "• Paper is loaded\n"
+                                     "• Printer drivers are installed")
+                if on_complete is not None:
+                    on_complete(False)
+                return False
 
+            # Show printing status; it keeps animating because the
+            # mainloop is no longer blocked by the print I/O
             status_dialog = self._show_printing_status()
-            # Generate receipt text
-            receipt_text = self.generate_receipt_text(table_data)
-
-            # Try Windows thermal printer first
-            success = self._print_to_windows_thermal_printer(receipt_text)
-
-            # Close status dialog
-            if status_dialog:
-                status_dialog.destroy()
 
-            if success:
-                messagebox.showinfo("Print Success",
-                                    "🖨️ Receipt printed successfully!")
-            else:
-                # Fallback to default system printer
-                fallback_success = self._print_to_windows_thermal_printer(receipt_text)
-                if fallback_success:
+            def on_done(success: bool) -> None:
+                if status_dialog:
+                    self._hide_printing_status(status_dialog)
+                if success:
                     messagebox.showinfo("Print Success",
-                                        "🖨️ Receipt printed to system printer!")
+                                        "🖨️ Receipt printed successfully!")
                 else:
                     messagebox.showerror("Print Error",
                                          "❌ Failed to print receipt!\n\n"
@@ -461,27 +1097,53 @@ class ReceiptManager:
                                          "• Printer is connected and powered ON\n"
                                          "• Paper is loaded\n"
                                          "• Printer drivers are installed")
+                if on_complete is not None:
+                    on_complete(success)
+
+            marshal_widget = status_dialog or parent_window
+
+            def worker() -> None:
+                success = self._send_to_windows_printer(payload, printer_name)
+                if marshal_widget is not None:
+                    marshal_widget.after(0, lambda: on_done(success))
+                else:
+                    print(f"Print finished, success={success}")
+
+            threading.Thread(target=worker, daemon=True).start()
+            return True
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to print receipt: {e}")
+            if on_complete is not None:
+                on_complete(False)
             return False
 
     def _show_printing_status(self):
-        """Show printing status dialog"""
+        """Show printing status dialog (built once, reused)"""
         try:
-            dialog = tk.Toplevel()
-            dialog.title("Printing...")
-            dialog.geometry("300x150")
-            dialog.resizable(False, False)
-            dialog.grab_set()
+            dialog = self._printing_status_dialog
+            if dialog is None or not dialog.winfo_exists():
+                dialog = tk.Toplevel()
+                dialog.title("Printing...")
+                dialog.geometry("300x150")
+                dialog.resizable(False, False)
+                dialog.withdraw()
+
+                self._center_window(dialog, 300, 150)
 
-            self._center_window(dialog, 300, 150)
+                fonts = self._shared_fonts()
+                tk.Label(dialog, text="🖨️", font=fonts['icon']).pack(pady=10)
+                tk.Label(dialog, text="Printing receipt...", font=fonts['bold']).pack()
+                tk.Label(dialog, text="Please wait", font=fonts['med'], fg='gray').pack(pady=5)
 
-            tk.Label(dialog, text="🖨️", font=('Arial', 24)).pack(pady=10)
-            tk.Label(dialog, text="Printing receipt...", font=('Arial', 12, 'bold')).pack()
-            tk.Label(dialog, text="Please wait", font=('Arial', 10), fg='gray').pack(pady=5)
+                self._printing_status_dialog = dialog
 
-            dialog.update()
+            dialog.deiconify()
+            dialog.lift()
+            dialog.grab_set()
+            # update_idletasks paints the dialog without draining input
+            # events, so no re-entrant callbacks can fire from here
+            dialog.update_idletasks()
             return dialog
 
         except Exception as e:
@@ -491,8 +1153,6 @@ class ReceiptManager:
     def save_receipt(self, table_data: dict, parent_window=None) -> bool:
         """Save receipt to file"""
         try:
-            from tkinter import filedialog
-            
             # Generate receipt text
             receipt_text = self.generate_receipt_text(table_data)
             
@@ -522,11 +1182,9 @@ class ReceiptManager:
             messagebox.showerror("Error", f"Failed to save receipt: {e}")
             return False
 
-    def _print_with_win32print(self, content, printer_name):
-        """Print using win32print library with proper thermal printer handling"""
+    def _print_with_win32print(self, thermal_data, printer_name):
+        """Print pre-formatted ESC/POS bytes through win32print"""
         try:
-            import win32print
-
             print(f"Attempting to print to: {printer_name}")
 
             # Open printer
@@ -541,22 +1199,14 @@ class ReceiptManager:
                     # Start page
                     win32print.StartPagePrinter(printer_handle)
 
-                    # Convert content to thermal printer format
-                    thermal_data = self._format_for_thermal_printer(content)
-
                     print(f"Sending {len(thermal_data)} bytes to printer")
 
-                    # Send data in chunks to avoid buffer overflow
-                    chunk_size = 1024
-                    for i in range(0, len(thermal_data), chunk_size):
-                        chunk = thermal_data[i:i + chunk_size]
-                        bytes_written = win32print.WritePrinter(printer_handle, chunk)
-                        print(f"Wrote {bytes_written} bytes (chunk {i//chunk_size + 1})")
-                        time.sleep(0.1)  # Small delay between chunks
-
-                    # CRITICAL FIX: Ensure all data is flushed before ending
-                    import win32api
-                    win32api.Sleep(500)  # Wait 500ms for printer to process
+                    # One WritePrinter call: the spooler buffers the job
+                    # and feeds the printer at its own pace, so chunking
+                    # with sleeps only slowed the UI-facing path down
+                    bytes_written = win32print.WritePrinter(printer_handle, thermal_data)
+                    print(f"Wrote {bytes_written} bytes")
+
                     # End page
                     win32print.EndPagePrinter(printer_handle)
 
@@ -575,147 +1225,72 @@ class ReceiptManager:
 
     def _format_for_thermal_printer(self, content):
         """Format content for thermal printer with proper ESC/POS commands"""
-        try:
-            raw_data = b''
-
-            # Initialize printer - clear any previous state
-            raw_data += b'\x1b@'  # ESC @ - Initialize printer
-            raw_data += b'\x1bt\x00'  # Select character code table (PC437)
-
-            lines = content.split('\n')
-
-            for line in lines:
-                if line.startswith('✂'):  # Skip cut indicators
-                    continue
-
-                line_stripped = line.strip()
-
-                # Apply formatting based on content
-                if line_stripped == "KALYUG CAFE":
-                    raw_data += b'\x1ba\x01'  # Center align
-                    raw_data += b'\x1bE\x01'  # Bold on
-                    raw_data += b'\x1b!\x11'  # Double height and width
-                    raw_data += line_stripped.encode('utf-8', errors='ignore') + b'\n'
-                    raw_data += b'\x1b!\x00'  # Normal size
-                    raw_data += b'\x1bE\x00'  # Bold off
-                    raw_data += b'\x1ba\x00'  # Left align
-
-                elif line_stripped == "SALES RECEIPT":
-                    raw_data += b'\x1ba\x01'  # Center align
-                    raw_data += b'\x1bE\x01'  # Bold on
-                    raw_data += b'\x1b!\x10'  # Double width
-                    raw_data += line_stripped.encode('utf-8', errors='ignore') + b'\n'
-                    raw_data += b'\x1b!\x00'  # Normal size
-                    raw_data += b'\x1bE\x00'  # Bold off
-                    raw_data += b'\x1ba\x00'  # Left align
-                    raw_data += b'\n'  # Extra line after receipt title
-
-                elif "Gross Total" in line:
-                    raw_data += b'\x1bE\x01'  # Bold on
-                    raw_data += line.encode('utf-8', errors='ignore') + b'\n'
-                    raw_data += b'\x1bE\x00'  # Bold off
-
-                elif line_stripped == "Thank You!":
-                    raw_data += b'\x1ba\x01'  # Center align
-                    raw_data += line_stripped.encode('utf-8', errors='ignore') + b'\n'
-                    raw_data += b'\x1ba\x00'  # Left align
-                elif line_stripped == "Visit Again!":
-                    raw_data += b'\x1ba\x01'  # Center align
-                    raw_data += line_stripped.encode('utf-8', errors='ignore') + b'\n'
-                    raw_data += b'\x1ba\x00'  # Left align
-                    # CRITICAL FIX: Add sufficient spacing after "Have a Nice day"
-                    raw_data += b'\n' * 4  # Add 4 extra line feeds to ensure text is printed
-                else:
-                    # Regular lines (items, totals, separators)
-                    raw_data += line.encode('utf-8', errors='ignore') + b'\n'
-
-            # Optional: Add a form feed to ensure all content is processed
-            raw_data += b'\x0c'  # Form feed
+        return _format_receipt_payload(content)
 
-            # Final cut command
-            raw_data += b'\x1dV\x00'  # Full cut
-
-            print(f"Generated thermal data: {len(raw_data)} bytes")
-            return raw_data
-
-        except Exception as e:
-            print(f"Error formatting for thermal printer: {e}")
-            return content.encode('utf-8', errors='ignore')
-
-    def _print_with_system_command(self, content, printer_name):
-        """Print using system command with thermal printer optimization"""
+    def _print_with_system_command(self, thermal_data, printer_name):
+        """Send pre-formatted ESC/POS bytes to the printer's local share"""
         try:
-            import tempfile
-            import os
-            import subprocess
-
-            # For thermal printers, we need to send raw data
-            thermal_data = self._format_for_thermal_printer(content)
+            # Write straight to the share: the copy /B detour through a
+            # temp file did the same thing with a disk round-trip, a
+            # cmd.exe spawn and a file left behind to clean up
+            share = rf'\\localhost\{printer_name}'
+            try:
+                with open(share, 'wb') as printer_file:
+                    printer_file.write(thermal_data)
+                print(f"✅ Successfully printed to {printer_name} via share write")
+                return True
+            except OSError as e:
+                print(f"❌ Direct share write failed: {e}")
 
-            # Create temporary binary file for raw data
+            # Fallback: the print command needs an on-disk file
             with tempfile.NamedTemporaryFile(mode='wb', suffix='.prn', delete=False) as temp_file:
                 temp_file.write(thermal_data)
                 temp_file_path = temp_file.name
 
             try:
-                # Use copy command to send raw data to printer
-                cmd = f'copy /B "{temp_file_path}" "\\\\localhost\\{printer_name}"'
-                print(f"Executing: {cmd}")
-
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=30)
+                cmd = ['cmd', '/c', 'print', f'/D:{printer_name}', temp_file_path]
+                result = subprocess.run(cmd, capture_output=True, timeout=30)
 
                 if result.returncode == 0:
-                    print(f"✅ Successfully printed to {printer_name} via copy command")
+                    print(f"✅ Successfully printed to {printer_name} via print command")
                     return True
-                else:
-                    print(f"❌ Copy command failed: {result.stderr}")
-
-                    # Fallback to print command with text file
-                    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as text_file:
-                        text_file.write(content)
-                        text_file_path = text_file.name
-
-                    cmd2 = f'print /D:"{printer_name}" "{text_file_path}"'
-                    result2 = subprocess.run(cmd2, shell=True, capture_output=True, text=True, timeout=30)
-
-                    if result2.returncode == 0:
-                        print(f"✅ Successfully printed to {printer_name} via print command")
-                        return True
-                    else:
-                        print(f"❌ Print command also failed: {result2.stderr}")
-                        return False
+                print(f"❌ Print command failed: {result.stderr.decode(errors='ignore')}")
+                return False
 
             finally:
-                # Clean up temp files after delay
-                self.sales_tab.frame.after(5000, lambda: self._cleanup_temp_file(temp_file_path))
+                try:
+                    os.unlink(temp_file_path)
+                except OSError:
+                    pass
 
         except Exception as e:
             print(f"Error with system print command: {e}")
             return False
 
-    def _print_to_printer_port(self, content, printer_name):
-        """Try to print directly to printer port"""
+    def _print_to_printer_port(self, thermal_data, printer_name):
+        """Write pre-formatted ESC/POS bytes directly to the printer port"""
         try:
-            import subprocess
-
-            # Get printer port information
-            ps_command = f'''
-            Get-WmiObject -Class Win32_Printer | Where-Object {{
-                $_.Name -eq "{printer_name}"
-            }} | Select-Object -ExpandProperty PortName
-            '''
-
-            result = subprocess.run(['powershell', '-Command', ps_command],
-                                    capture_output=True, text=True, timeout=10)
+            # Port remembered during enumeration; only ask WMI again if
+            # this printer was never enumerated in this session
+            port_name = self._printer_port_map.get(printer_name)
+            if not port_name:
+                ps_command = f'''
+                Get-CimInstance -Query "SELECT PortName FROM Win32_Printer WHERE Name='{printer_name}'" |
+                    Select-Object -ExpandProperty PortName
+                '''
+
+                result = subprocess.run(_POWERSHELL + [ps_command],
+                                        capture_output=True, timeout=10)
+
+                if result.returncode != 0:
+                    return False
+                port_name = _decode_ps_output(result.stdout).strip()
 
-            if result.returncode == 0 and result.stdout.strip():
-                port_name = result.stdout.strip()
+            if port_name:
                 print(f"Found printer port: {port_name}")
 
                 # If it's a USB port, try direct write
                 if 'USB' in port_name.upper():
-                    thermal_data = self._format_for_thermal_printer(content)
-
                     # Try to write directly to the port
                     try:
                         with open(f'\\\\.\\{port_name}', 'wb') as port_file:
@@ -734,116 +1309,136 @@ class ReceiptManager:
             return False
 
     def _select_thermal_printer(self, printers):
-        """Show dialog to select thermal printer"""
-        try:
-            dialog = tk.Toplevel()
-            dialog.title("Select Thermal Printer")
-            dialog.geometry("500x400")
-            dialog.resizable(False, False)
-            dialog.grab_set()
-            dialog.configure(bg='#f8f9fa')
-
-            self._center_window(dialog, 500, 400)
+        """Show dialog to select thermal printer.
 
-            # Main frame
-            main_frame = tk.Frame(dialog, bg='#f8f9fa', padx=20, pady=20)
-            main_frame.pack(fill=tk.BOTH, expand=True)
-
-            # Header
-            header_frame = tk.Frame(main_frame, bg='#007bff', relief='flat', pady=10)
-            header_frame.pack(fill=tk.X, pady=(0, 20))
-
-            tk.Label(header_frame, text="🖨️ Select Your Thermal Printer",
-                     font=('Arial', 14, 'bold'), fg='white', bg='#007bff').pack()
-
-            tk.Label(header_frame, text="Multiple printers found. Please select yours:",
-                     font=('Arial', 10), fg='white', bg='#007bff').pack(pady=(5, 0))
+        The dialog is built once and reused: showing it again refills
+        the listbox and deiconifies the window instead of recreating
+        every widget. Blocks like a modal until the user answers.
+        """
+        try:
+            dialog = self._printer_dialog
+            if dialog is None or not dialog.winfo_exists():
+                self._build_printer_dialog()
+                dialog = self._printer_dialog
+
+            # Refill the listbox for this enumeration in one Tcl call
+            self._printer_dialog_printers = printers
+            listbox = self._printer_listbox
+            listbox.delete(0, tk.END)
+            listbox.insert(tk.END, *(f"{i+1}. {_printer_display(printer)}"
+                                     for i, printer in enumerate(printers)))
 
-            # Printer list frame
-            list_frame = tk.Frame(main_frame, bg='white', relief='solid', bd=1)
-            list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
+            # Select first by default
+            if printers:
+                listbox.selection_set(0)
+                listbox.activate(0)
 
-            # Listbox with scrollbar
-            listbox_frame = tk.Frame(list_frame)
-            listbox_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            self._printer_selected = None
+            dialog.deiconify()
+            dialog.lift()
+            dialog.grab_set()
+            listbox.focus_set()
 
-            listbox = tk.Listbox(listbox_frame, font=('Arial', 10), height=12,
-                                 selectmode=tk.SINGLE, bg='white', fg='black',
-                                 selectbackground='#007bff', selectforeground='white')
+            # Block until a button (or window close) writes the choice
+            dialog.wait_variable(self._printer_choice)
 
-            scrollbar = tk.Scrollbar(listbox_frame, orient=tk.VERTICAL, command=listbox.yview)
-            listbox.configure(yscrollcommand=scrollbar.set)
+            dialog.grab_release()
+            dialog.withdraw()
+            return self._printer_selected
 
-            # Add printers to listbox
-            for i, printer in enumerate(printers):
-                # Extract just the printer name (before " - Port:")
-                printer_name = printer.split(" - Port:")[0]
-                display_text = f"{i+1}. {printer}"
-                listbox.insert(tk.END, display_text)
+        except Exception as e:
+            print(f"Error in printer selection dialog: {e}")
+            messagebox.showerror("Error", f"Failed to show printer selection: {str(e)}")
+            return None
 
-            # Select first by default
-            if printers:
-                listbox.selection_set(0)
-                listbox.activate(0)
+    def _build_printer_dialog(self):
+        """Create the reusable printer-selection dialog (hidden until shown)"""
+        dialog = tk.Toplevel()
+        dialog.title("Select Thermal Printer")
+        dialog.geometry("500x400")
+        dialog.resizable(False, False)
+        dialog.configure(bg='#f8f9fa')
+        dialog.withdraw()  # Shown by _select_thermal_printer
 
-            listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._center_window(dialog, 500, 400)
 
-            # Buttons frame
-            button_frame = tk.Frame(main_frame, bg='#f8f9fa')
-            button_frame.pack(fill=tk.X)
+        # Main frame
+        main_frame = tk.Frame(dialog, bg='#f8f9fa', padx=20, pady=20)
+        main_frame.pack(fill=tk.BOTH, expand=True)
 
-            selected_printer = [None]
+        # Header
+        header_frame = tk.Frame(main_frame, bg='#007bff', relief='flat', pady=10)
+        header_frame.pack(fill=tk.X, pady=(0, 20))
 
-            def select_printer():
-                selection = listbox.curselection()
-                if selection:
-                    selected_text = listbox.get(selection[0])
-                    # Extract original printer info
-                    printer_index = selection[0]
-                    # Get just the printer name (before " - Port:")
-                    selected_printer[0] = printers[printer_index].split(" - Port:")[0]
-                    dialog.destroy()
-                else:
-                    messagebox.showwarning("No Selection", "Please select a printer!")
+        tk.Label(header_frame, text="🖨️ Select Your Thermal Printer",
+                 font=('Arial', 14, 'bold'), fg='white', bg='#007bff').pack()
 
-            def cancel():
-                selected_printer[0] = None
-                dialog.destroy()
+        tk.Label(header_frame, text="Multiple printers found. Please select yours:",
+                 font=('Arial', 10), fg='white', bg='#007bff').pack(pady=(5, 0))
 
-            # Double-click to select
-            def on_double_click(event):
-                select_printer()
+        # Printer list frame
+        list_frame = tk.Frame(main_frame, bg='white', relief='solid', bd=1)
+        list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
 
-            listbox.bind("<Double-Button-1>", on_double_click)
+        # Listbox with scrollbar
+        listbox_frame = tk.Frame(list_frame)
+        listbox_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-            # Buttons
-            select_btn = tk.Button(button_frame, text="✅ Select Printer", command=select_printer,
-                                   bg='#28a745', fg='white', font=('Arial', 11, 'bold'),
-                                   relief='flat', padx=20, pady=10, cursor='hand2')
-            select_btn.pack(side=tk.LEFT, padx=(0, 10))
+        listbox = tk.Listbox(listbox_frame, font=('Arial', 10), height=12,
+                             selectmode=tk.SINGLE, bg='white', fg='black',
+                             selectbackground='#007bff', selectforeground='white')
 
-            cancel_btn = tk.Button(button_frame, text="❌ Cancel", command=cancel,
-                                   bg='#dc3545', fg='white', font=('Arial', 11, 'bold'),
-                                   relief='flat', padx=20, pady=10, cursor='hand2')
-            cancel_btn.pack(side=tk.RIGHT)
+        scrollbar = tk.Scrollbar(listbox_frame, orient=tk.VERTICAL, command=listbox.yview)
+        listbox.configure(yscrollcommand=scrollbar.set)
 
-            # Info label
-            info_label = tk.Label(main_frame,
-                                  text="💡 Double-click on a printer to select it quickly",
-                                  font=('Arial', 9), fg='#6c757d', bg='#f8f9fa')
-            info_label.pack(pady=(10, 0))
+        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-            # Focus on listbox
-            listbox.focus_set()
+        # Buttons frame
+        button_frame = tk.Frame(main_frame, bg='#f8f9fa')
+        button_frame.pack(fill=tk.X)
 
-            dialog.wait_window()
-            return selected_printer[0]
+        choice = tk.IntVar(master=dialog, value=0)
 
-        except Exception as e:
-            print(f"Error in printer selection dialog: {e}")
-            messagebox.showerror("Error", f"Failed to show printer selection: {str(e)}")
-            return None
+        def select_printer():
+            selection = listbox.curselection()
+            if selection:
+                self._printer_selected = self._printer_dialog_printers[selection[0]].name
+                choice.set(choice.get() + 1)
+            else:
+                messagebox.showwarning("No Selection", "Please select a printer!")
+
+        def cancel():
+            self._printer_selected = None
+            choice.set(choice.get() + 1)
+
+        # Double-click to select
+        listbox.bind("<Double-Button-1>", lambda e: select_printer())
+
+        # Buttons
+        select_btn = tk.Button(button_frame, text="✅ Select Printer", command=select_printer,
+                               bg='#28a745', fg='white', font=('Arial', 11, 'bold'),
+                               relief='flat', padx=20, pady=10, cursor='hand2')
+        _register_hover(select_btn, '#218838')
+        select_btn.pack(side=tk.LEFT, padx=(0, 10))
+
+        cancel_btn = tk.Button(button_frame, text="❌ Cancel", command=cancel,
+                               bg='#dc3545', fg='white', font=('Arial', 11, 'bold'),
+                               relief='flat', padx=20, pady=10, cursor='hand2')
+        _register_hover(cancel_btn, '#c82333')
+        cancel_btn.pack(side=tk.RIGHT)
+
+        # Info label
+        info_label = tk.Label(main_frame,
+                              text="💡 Double-click on a printer to select it quickly",
+                              font=('Arial', 9), fg='#6c757d', bg='#f8f9fa')
+        info_label.pack(pady=(10, 0))
+
+        dialog.protocol("WM_DELETE_WINDOW", cancel)
+
+        self._printer_dialog = dialog
+        self._printer_listbox = listbox
+        self._printer_choice = choice
 
     def _center_window(self, window, width, height):
         """Center window on screen"""
@@ -3,7 +3,15 @@
 Main window for the sales management system
 """
 
+import hashlib
+import hmac
+import operator
+import os
+import threading
+import uuid
+from collections import Counter, defaultdict, deque
 import tkinter as tk
+import tkinter.simpledialog as simpledialog
 from datetime import datetime
 from tkinter import ttk, messagebox
 from typing import Optional
@@ -13,6 +21,128 @@ import json
 from pathlib import Path
 from ..utils.receipt_manager import ReceiptManager
 
+# Translation table for stripping the currency symbol from display strings
+_CURRENCY_STRIP = str.maketrans('', '', '₹')
+
+# The daily sales files go through orjson when available (C parser,
+# emits bytes directly); the stdlib json fallback keeps the same
+# bytes-in/bytes-out contract
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Data directory shared by the daily-sales and audit files, resolved once
+DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
+AUDIT_FILE = DATA_DIR / "order_removals_audit.jsonl"
+
+def _daily_file(date_str: str) -> Path:
+    """Path of the daily sales file for the given YYYY-MM-DD date"""
+    return DATA_DIR / f"daily_sales_{date_str}.json"
+
+# Admin password hash, loaded once at import. Set ADMIN_PASSWORD_HASH to
+# an argon2 hash (preferred, verified natively when argon2-cffi is
+# installed) or a sha256 hex digest to rotate the password without a
+# code change. The default is the sha256 of the previous built-in
+# password.
+_ADMIN_HASH = os.environ.get(
+    'ADMIN_PASSWORD_HASH',
+    '184ae3144d54075de76f5c7f8a0c6ca5b562d64a7b6e2eb2f97e7f3664a1fe32')
+
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import VerificationError
+    _PASSWORD_HASHER = PasswordHasher()
+except ImportError:
+    _PASSWORD_HASHER = None
+
+def _verify_admin_hash(entered_password: str) -> bool:
+    """Check a password against the configured admin hash in constant time"""
+    if _PASSWORD_HASHER is not None and _ADMIN_HASH.startswith('$argon2'):
+        try:
+            return _PASSWORD_HASHER.verify(_ADMIN_HASH, entered_password)
+        except VerificationError:
+            return False
+    digest = hashlib.sha256(entered_password.encode('utf-8')).hexdigest()
+    return hmac.compare_digest(digest, _ADMIN_HASH)
+
+# Keys every usable product entry must carry; checked with a C-level
+# set comparison against dict.keys()
+_REQUIRED_PRODUCT_KEYS = frozenset(('name', 'display_name', 'amount'))
+
+# Fast extractor for the common product schema; C-implemented itemgetter
+# beats the four-way .get() chains when the keys are present
+_FAST_PRODUCT_FIELDS = operator.itemgetter('name', 'display_name', 'amount')
+
+# Color schemes for menu categories
+_CATEGORY_COLORS = [
+    {'bg': '#0078d4', 'fg': '#ffffff', 'hover_bg': '#1a86d9'},  # Blue
+    {'bg': '#107c10', 'fg': '#ffffff', 'hover_bg': '#128a12'},  # Green
+    {'bg': '#d13438', 'fg': '#ffffff', 'hover_bg': '#dc4144'},  # Red
+    {'bg': '#ff8c00', 'fg': '#ffffff', 'hover_bg': '#ff9a1a'},  # Orange
+    {'bg': '#5c2d91', 'fg': '#ffffff', 'hover_bg': '#6b3aa0'},  # Purple
+    {'bg': '#00bcf2', 'fg': '#ffffff', 'hover_bg': '#1ac6f7'},  # Cyan
+    {'bg': '#ca5010', 'fg': '#ffffff', 'hover_bg': '#d45a1a'},  # Brown
+    {'bg': '#8764b8', 'fg': '#ffffff', 'hover_bg': '#9674c7'},  # Lavender
+]
+
+def _parse_nonneg_float(text: str) -> Optional[float]:
+    """Parse a non-negative float, returning None on bad input.
+
+    Cheap string checks up front avoid raising/catching ValueError on
+    every keystroke-driven submit (the common case is valid input).
+    isdecimal (not isdigit) matches what float()/int() accept: isdigit
+    also passes superscripts and circled digits, which would raise.
+    """
+    text = text.strip()
+    if not text.replace('.', '', 1).isdecimal():
+        return None
+    return float(text)
+
+def _parse_pos_int(text: str) -> Optional[int]:
+    """Parse a positive integer, returning None on bad input"""
+    text = text.strip()
+    if not text.isdecimal():
+        return None
+    value = int(text)
+    return value if value > 0 else None
+
+# Alternating row tags; styling lives in tag_configure so per-row work
+# stays a tag name, never an item-configure call
+_ROW_TAGS = ('even', 'odd')
+
+def _configure_row_tags(tree: ttk.Treeview) -> None:
+    """Register the alternating row-stripe tags on a treeview once"""
+    tree.tag_configure('even', background='#1e1e1e')
+    tree.tag_configure('odd', background='#252525')
+
+def _bulk_insert(tree: ttk.Treeview, rows) -> None:
+    """Insert (iid, values[, tags]) rows into a treeview in one tight Tcl loop.
+
+    Issuing the Tcl command directly skips the per-call Tkinter wrapper
+    overhead; combined with populating trees before they are packed,
+    the whole batch costs a single layout pass instead of one per row.
+    """
+    call = tree.tk.call
+    path = tree._w
+    for row in rows:
+        iid, values = row[0], row[1]
+        args = (path, 'insert', '', 'end')
+        if iid is not None:
+            args += ('-id', iid)
+        args += ('-values', values)
+        if len(row) > 2:
+            args += ('-tags', row[2])
+        call(*args)
+
 class MainWindow:
     """Main application window with modern dark theme"""
 
@@ -23,8 +153,43 @@ class MainWindow:
         self.current_table_name: Optional[str] = None
         self.receipt_manager = ReceiptManager()  # Add this line
 
+        # Resolve the productData folder once instead of per load
+        self._product_data_dir = Path(__file__).resolve().parent.parent.parent / "productData"
+
+        # Parsed product data cached against the newest file mtime; the lock
+        # guards the cache because the initial load runs on a worker thread
+        self._product_cache = None
+        self._product_cache_mtime = 0.0
+        self._product_cache_lock = threading.Lock()
+
+        # Shadow map of tree iid -> SaleItem so handlers can read the original
+        # object instead of re-parsing the formatted display strings
+        self._row_items = {}
+
+        # Tooltip texts keyed by widget path; served by two class-level
+        # bindings and one shared tooltip window instead of per-button binds
+        self._tooltips = {}
+        self._tooltip_win = None
+        self._tooltip_label = None
+
+        # Recently removed items kept for the transient undo toast
+        self._undo_stack = []
+        self._undo_toast = None
+        self._undo_job = None
+
+        # Debounced status bar writes: only the latest message within a
+        # 50ms window reaches the label
+        self._status_pending: Optional[str] = None
+        self._status_job = None
+
+        # Accumulated mousewheel delta flushed in one scroll per idle
+        # cycle (see setup_items_panel)
+        self._pending_wheel = 0
+        self._wheel_job = None
+
         self.setup_window()
         self.setup_dark_theme()
+        self._init_category_styles()
         self.setup_ui()
         self.setup_bindings()
 
@@ -131,6 +296,41 @@ class MainWindow:
         style.configure('Vertical.TScrollbar', background='#404040', troughcolor='#2d2d2d',
                         borderwidth=0, arrowcolor='#ffffff')
 
+    def _init_category_styles(self) -> None:
+        """Precompute category button styles and menu font sizes
+
+        Style configuration mutates the global Tcl option database, so doing
+        it once per color scheme at startup avoids N configure/map round
+        trips on every menu render.
+        """
+        screen_width = self.root.winfo_screenwidth()
+        self._screen_width = screen_width
+        if screen_width >= 1920:
+            self._header_font_size = 14
+        elif screen_width >= 1366:
+            self._header_font_size = 12
+        else:
+            self._header_font_size = 11
+        self._font_size = 15
+
+        style = ttk.Style()
+        self._category_styles = []
+        for index, color_scheme in enumerate(_CATEGORY_COLORS, start=1):
+            style_name = f'Category{index}.TButton'
+            style.configure(style_name,
+                            background=color_scheme['bg'],
+                            foreground=color_scheme['fg'],
+                            font=('Segoe UI', self._font_size, 'bold'),
+                            relief='flat',
+                            borderwidth=2,
+                            padding=(10, 6),
+                            focuscolor='none')
+            style.map(style_name,
+                      background=[('active', color_scheme['hover_bg']),
+                                  ('pressed', color_scheme['bg'])],
+                      relief=[('pressed', 'sunken')])
+            self._category_styles.append(style_name)
+
     def setup_ui(self) -> None:
         """Setup the user interface"""
         # Add menu bar
@@ -260,6 +460,8 @@ class MainWindow:
         if messagebox.askyesno("Confirm", "Clear all finalized tables? This will make them available for new orders."):
             cleared_count = 0
             tables = self.controller.get_tables()
+            # getattr once instead of a hasattr probe per table
+            clear_table = getattr(self.controller, 'clear_table', None)
 
             for table in tables:
                 if not table.is_active:  # Finalized table
@@ -268,15 +470,15 @@ class MainWindow:
                         self.save_to_daily_sales(table)
 
                     table_name = f"Table {table.table_number}"
-                    if hasattr(self.controller, 'clear_table'):
-                        if self.controller.clear_table(table_name):
+                    if clear_table is not None:
+                        if clear_table(table_name):
                             cleared_count += 1
                     else:
                         # Fallback: delete the table
                         if self.controller.delete_table(table_name):
                             cleared_count += 1
 
-            self.status_label.config(text=f"🧹 Cleared {cleared_count} finalized tables")
+            self._set_status(f"🧹 Cleared {cleared_count} finalized tables")
 
             # Force refresh all data and UI components
             self.refresh_all_data()
@@ -294,14 +496,19 @@ class MainWindow:
     def save_to_daily_sales(self, table) -> None:
         """Save finalized table data to daily sales records"""
         try:
-            from datetime import datetime
-            import json
 
             # Create sales data structure
+            finalized_at = datetime.now().isoformat()
             sales_data = {
+                "order_id": uuid.uuid4().hex,
                 "table_name": f"Table {table.table_number}",
                 "table_number": table.table_number,
-                "finalized_at": datetime.now().isoformat(),
+                "finalized_at": finalized_at,
+                # Precomputed display/bucket fields so later readers can
+                # use plain string compares instead of reparsing the ISO
+                # timestamp
+                "time_str": finalized_at[11:19],
+                "hour_bucket": finalized_at[11:13] + ":00",
                 "items": [],
                 "total_amount": table.get_total(),
                 "items_count": len(table.items)
@@ -327,20 +534,15 @@ class MainWindow:
     def update_daily_sales(self, sales_data: dict) -> None:
         """Update daily sales summary and detailed records"""
         try:
-            from datetime import datetime
 
-            # Get the data directory path
-            current_dir = Path(__file__).parent.parent.parent
-            data_dir = current_dir / "data"
-            data_dir.mkdir(exist_ok=True)
+            DATA_DIR.mkdir(exist_ok=True)
 
             today = datetime.now().strftime("%Y-%m-%d")
-            daily_sales_file = data_dir / f"daily_sales_{today}.json"
+            daily_sales_file = _daily_file(today)
 
             # Load existing daily data or create new
             if daily_sales_file.exists():
-                with open(daily_sales_file, 'r', encoding='utf-8') as f:
-                    daily_data = json.load(f)
+                daily_data = _loads(daily_sales_file.read_bytes())
             else:
                 daily_data = {
                     "date": today,
@@ -364,7 +566,7 @@ class MainWindow:
                     daily_data["items_sold"][item_name] = item["quantity"]
 
             # Update hourly breakdown
-            hour = datetime.fromisoformat(sales_data["finalized_at"]).strftime("%H:00")
+            hour = sales_data.get("hour_bucket") or sales_data["finalized_at"][11:13] + ":00"
             if hour in daily_data["hourly_breakdown"]:
                 daily_data["hourly_breakdown"][hour] += sales_data["total_amount"]
             else:
@@ -374,8 +576,7 @@ class MainWindow:
             daily_data["orders"].append(sales_data)
 
             # Save daily data
-            with open(daily_sales_file, 'w', encoding='utf-8') as f:
-                json.dump(daily_data, f, indent=2, ensure_ascii=False)
+            daily_sales_file.write_bytes(_dumps(daily_data))
 
         except Exception as e:
             print(f"Error updating daily sales: {e}")
@@ -396,7 +597,7 @@ class MainWindow:
         # Update UI displays
         self.refresh_table_details()
         self.update_table_button_colors()
-        self.status_label.config(text=f"📋 Selected {table_name}")
+        self._set_status(f"📋 Selected {table_name}")
 
     def clear_selected_table(self, auto_clear: bool = False) -> None:
         """Clear the selected table (make it available for reuse)"""
@@ -422,17 +623,18 @@ class MainWindow:
                 return
 
         # Use existing delete method or clear items
-        if hasattr(self.controller, 'clear_table'):
-            success = self.controller.clear_table(self.current_table_name)
+        clear_table = getattr(self.controller, 'clear_table', None)
+        if clear_table is not None:
+            success = clear_table(self.current_table_name)
         else:
             # Fallback: delete the table entirely
             success = self.controller.delete_table(self.current_table_name)
 
         if success:
             if auto_clear:
-                self.status_label.config(text=f"✅ {self.current_table_name} cleared and ready for reuse")
+                self._set_status(f"✅ {self.current_table_name} cleared and ready for reuse")
             else:
-                self.status_label.config(text=f"🧹 Cleared {self.current_table_name}")
+                self._set_status(f"🧹 Cleared {self.current_table_name}")
             # Force refresh the table details immediately
             self.refresh_table_details()
             self.update_table_button_colors()
@@ -554,16 +756,34 @@ class MainWindow:
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
 
-        # Load and display products with enhanced layout
-        self.load_and_display_products(scrollable_frame)
+        # Keep a direct reference so refreshes don't have to walk the
+        # widget tree looking for this frame
+        self._product_scrollable_frame = scrollable_frame
+
+        # Load products on a worker thread so startup doesn't block on disk I/O
+        ttk.Label(scrollable_frame, text="⏳ Loading menu...",
+                  style='Title.TLabel').pack(pady=50)
+        self._async_load_products(scrollable_frame)
 
         # Grid canvas and scrollbar
         canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
 
-        # Enhanced mousewheel binding with better scroll speed
+        # Enhanced mousewheel binding with better scroll speed.
+        # Wheel events arrive in bursts; accumulate the deltas and apply
+        # them in one yview_scroll per idle cycle so the canvas repaints
+        # once per burst instead of once per notch.
+        def _flush_wheel():
+            units = int(-1 * (self._pending_wheel / 60))
+            self._pending_wheel = 0
+            self._wheel_job = None
+            if units:
+                canvas.yview_scroll(units, "units")
+
         def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/60)), "units")  # Smoother scrolling
+            self._pending_wheel += event.delta
+            if self._wheel_job is None:
+                self._wheel_job = canvas.after_idle(_flush_wheel)
         canvas.bind_all("<MouseWheel>", _on_mousewheel)
 
     def setup_status_bar(self) -> None:
@@ -587,6 +807,10 @@ class MainWindow:
         # Add right-click context menu for items tree
         self.items_tree.bind('<Button-3>', self.show_item_context_menu)
 
+        # Recompute screen-dependent sizes if the window lands on a
+        # different monitor; no polling, just the Configure event
+        self.root.bind('<Configure>', self._on_root_configure, add='+')
+
         # Keyboard shortcuts
         self.root.bind('<Control-n>', lambda e: self.create_new_table())
         self.root.bind('<Control-s>', lambda e: self.controller.save_data())
@@ -602,6 +826,35 @@ class MainWindow:
         # Add Enter key to edit quantity
         self.items_tree.bind('<Return>', lambda e: self.edit_item_quantity_dialog())
 
+        # Two shared bindings serve tooltips for every product button via the
+        # 'ProductTip' bindtag (O(1) bindings instead of one pair per button)
+        self.root.bind_class('ProductTip', '<Enter>', self._show_product_tooltip)
+        self.root.bind_class('ProductTip', '<Leave>', self._hide_product_tooltip)
+
+    def _on_root_configure(self, event) -> None:
+        """Refresh cached screen-dependent sizes after a monitor change"""
+        if event.widget is not self.root:
+            return
+        if self.root.winfo_screenwidth() != self._screen_width:
+            self._init_category_styles()
+
+    def _set_status(self, message: str) -> None:
+        """Queue a status bar update; bursts coalesce into one redraw.
+
+        Rapid item taps would otherwise redraw the label per add; only
+        the latest message within the 50ms window is written.
+        """
+        self._status_pending = message
+        if self._status_job is None:
+            self._status_job = self.root.after(50, self._flush_status)
+
+    def _flush_status(self) -> None:
+        """Write the most recent pending status message to the label"""
+        self._status_job = None
+        if self._status_pending is not None:
+            self.status_label.config(text=self._status_pending)
+            self._status_pending = None
+
     def on_item_double_click(self, event) -> None:
         """Handle double-click on items tree to edit quantity"""
         try:
@@ -624,15 +877,15 @@ class MainWindow:
             return
 
         try:
-            # Get current item details
-            item_values = self.items_tree.item(selection[0], "values")
-            if not item_values or len(item_values) < 4:
+            # Get current item details from the shadow map
+            item = self._row_items.get(selection[0])
+            if item is None:
                 messagebox.showerror("Error", "Invalid item selection!")
                 return
 
-            item_name = item_values[0]
-            current_qty = int(item_values[1])
-            item_price = item_values[2].replace('₹', '')
+            item_name = item.name
+            current_qty = item.quantity
+            item_price = f"{item.price:.2f}"
 
             # Create quantity edit dialog
             qty_window = tk.Toplevel(self.root)
@@ -728,20 +981,20 @@ class MainWindow:
 
             # Process result
             if result['confirmed']:
-                item_index = self.items_tree.index(selection[0])
+                item_index = int(selection[0])
                 new_qty = result['new_qty']
 
                 if new_qty == 0:
                     # If quantity is 0, ask to remove item
                     if messagebox.askyesno("Remove Item", f"Quantity is 0. Remove {item_name} from the table?"):
                         if self.controller.remove_item_from_table(self.current_table_name, item_index):
-                            self.status_label.config(text=f"❌ Removed {item_name}")
+                            self._set_status(f"❌ Removed {item_name}")
                         else:
                             messagebox.showerror("Error", "Failed to remove item!")
                 else:
                     # Update quantity
                     if self.controller.update_item_quantity(self.current_table_name, item_index, new_qty):
-                        self.status_label.config(text=f"🔄 Updated {item_name} quantity to {new_qty}")
+                        self._set_status(f"🔄 Updated {item_name} quantity to {new_qty}")
                     else:
                         messagebox.showerror("Error", "Failed to update quantity!")
 
@@ -791,23 +1044,59 @@ class MainWindow:
             print(f"Error showing context menu: {e}")
 
     def remove_selected_item_simple(self) -> None:
-        """Remove the selected item from the table (simplified version)"""
+        """Remove the selected item immediately with a short undo window"""
         if not self.current_table_name:
             messagebox.showwarning("Warning", "No table selected!")
             return
-    
+
         selection = self.items_tree.selection()
         if not selection:
             messagebox.showwarning("Warning", "Please select an item to remove!")
             return
-    
-        item_index = self.items_tree.index(selection[0])
-    
-        if messagebox.askyesno("Confirm", "Remove this item?"):
-            if self.controller.remove_item_from_table(self.current_table_name, item_index):
-                self.status_label.config(text="❌ Item removed")
+
+        item_index = int(selection[0])
+        item = self._row_items.get(selection[0])
+
+        # Delete without a confirmation dialog; the undo toast covers slips
+        # without blocking the event loop on a modal
+        if self.controller.remove_item_from_table(self.current_table_name, item_index):
+            self._set_status("❌ Item removed")
+            if item is not None:
+                self._undo_stack.append((self.current_table_name, item))
+                self._show_undo_toast(f"↩️ Undo remove {item.name}")
+        else:
+            messagebox.showerror("Error", "Failed to remove item!")
+
+    def _show_undo_toast(self, message: str) -> None:
+        """Show a transient clickable undo label in the status bar"""
+        if self._undo_toast is None:
+            self._undo_toast = ttk.Label(self.status_bar, text="",
+                                         style='Title.TLabel', cursor='hand2')
+            self._undo_toast.bind('<Button-1>', lambda e: self._undo_last_removal())
+
+        self._undo_toast.config(text=message)
+        self._undo_toast.pack(side=tk.RIGHT, padx=10)
+
+        if self._undo_job is not None:
+            self.root.after_cancel(self._undo_job)
+        self._undo_job = self.root.after(3000, self._hide_undo_toast)
+
+    def _hide_undo_toast(self) -> None:
+        """Hide the undo toast and drop the pending undo entries"""
+        self._undo_job = None
+        self._undo_stack.clear()
+        if self._undo_toast is not None:
+            self._undo_toast.pack_forget()
+
+    def _undo_last_removal(self) -> None:
+        """Restore the most recently removed item"""
+        if self._undo_stack:
+            table_name, item = self._undo_stack.pop()
+            if self.controller.add_item_to_table(table_name, item.name, item.price, item.quantity):
+                self._set_status(f"↩️ Restored {item.name}")
             else:
-                messagebox.showerror("Error", "Failed to remove item!")
+                messagebox.showerror("Error", "Failed to restore item!")
+        self._hide_undo_toast()
 
     def add_same_item(self) -> None:
         """Add another instance of the selected item"""
@@ -820,22 +1109,14 @@ class MainWindow:
             messagebox.showwarning("Warning", "Please select an item!")
             return
     
-        # Get item details from the tree
-        values = self.items_tree.item(selection[0], "values")
-        if values and len(values) >= 3:
-            item_name = values[0]
-            # Extract price from the price column (remove ₹ symbol)
-            price_str = values[2].replace('₹', '')
-            try:
-                price = float(price_str)
-                
-                # Add item to table
-                if self.controller.add_item_to_table(self.current_table_name, item_name, price, 1):
-                    self.status_label.config(text=f"🛒 Added another {item_name}")
-                else:
-                    messagebox.showerror("Error", "Failed to add item!")
-            except ValueError:
-                messagebox.showerror("Error", "Invalid price format!")
+        # Read the original item from the shadow map instead of re-parsing
+        # the formatted display strings
+        item = self._row_items.get(selection[0])
+        if item is not None:
+            if self.controller.add_item_to_table(self.current_table_name, item.name, item.price, 1):
+                self._set_status(f"🛒 Added another {item.name}")
+            else:
+                messagebox.showerror("Error", "Failed to add item!")
 
     def on_data_changed(self) -> None:
         """Handle data changes from controller"""
@@ -897,7 +1178,7 @@ class MainWindow:
 
         if messagebox.askyesno("Finalize Bill", f"{bill_text}\n\nFinalize this bill?"):
             if self.controller.finalize_table(self.current_table_name):
-                self.status_label.config(text=f"✅ Finalized {self.current_table_name}")
+                self._set_status(f"✅ Finalized {self.current_table_name}")
 
                 # Prepare table data for receipt
                 table_data = {
@@ -925,81 +1206,108 @@ class MainWindow:
     def show_receipt_options(self, table_data: dict) -> None:
         """Show receipt options after finalizing a bill"""
         try:
-            # Create receipt options window
-            options_window = tk.Toplevel(self.root)
-            options_window.title("📄 Receipt Options")
-            options_window.geometry("400x300")
-            options_window.configure(bg='#1e1e1e')
-            options_window.resizable(False, False)
+            # Build the dialog once and reuse it; widget construction is one
+            # of the slowest Tk operations and this dialog opens every bill
+            if not hasattr(self, '_receipt_dialog'):
+                self._build_receipt_dialog()
 
-            # Center the window
-            options_window.transient(self.root)
+            options_window = self._receipt_dialog
+
+            # Update the dynamic labels for this bill
+            total_amount = table_data.get('total_amount', 0)
+            table_name = table_data.get('table_name', 'Unknown')
+            self._receipt_table_lbl.config(text=f"Table: {table_name}")
+            self._receipt_total_lbl.config(text=f"Total: ₹{total_amount:.2f}")
+
+            # Rebind the receipt buttons to this bill's data
+            self._receipt_preview_btn.configure(
+                command=lambda td=table_data: self.preview_and_close(td, options_window))
+            self._receipt_print_btn.configure(
+                command=lambda td=table_data: self.print_and_close(td, options_window))
+            self._receipt_save_btn.configure(
+                command=lambda td=table_data: self.save_and_close(td, options_window))
+
+            options_window.deiconify()
             options_window.grab_set()
+            options_window.lift()
 
-            # Main frame
-            main_frame = ttk.Frame(options_window, padding="20")
-            main_frame.pack(fill=tk.BOTH, expand=True)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to show receipt options: {e}")
 
-            # Title
-            ttk.Label(main_frame, text="📄 Bill Finalized Successfully!",
-                      font=('Segoe UI', 14, 'bold'), foreground='#00d4ff').pack(pady=(0, 10))
+    def _build_receipt_dialog(self) -> None:
+        """Create the reusable receipt options dialog (hidden by default)"""
+        options_window = tk.Toplevel(self.root)
+        options_window.title("📄 Receipt Options")
+        options_window.geometry("400x300")
+        options_window.configure(bg='#1e1e1e')
+        options_window.resizable(False, False)
+        options_window.transient(self.root)
+        options_window.protocol("WM_DELETE_WINDOW",
+                                lambda: self._hide_receipt_dialog())
 
-            # Bill summary
-            total_amount = table_data.get('total_amount', 0)
-            table_name = table_data.get('table_name', 'Unknown')
+        # Main frame
+        main_frame = ttk.Frame(options_window, padding="20")
+        main_frame.pack(fill=tk.BOTH, expand=True)
 
-            ttk.Label(main_frame, text=f"Table: {table_name}",
-                      font=('Segoe UI', 12)).pack(pady=2)
-            ttk.Label(main_frame, text=f"Total: ₹{total_amount:.2f}",
-                      font=('Segoe UI', 12, 'bold'), foreground='#00ff88').pack(pady=2)
+        # Title
+        ttk.Label(main_frame, text="📄 Bill Finalized Successfully!",
+                  font=('Segoe UI', 14, 'bold'), foreground='#00d4ff').pack(pady=(0, 10))
 
-            ttk.Label(main_frame, text="What would you like to do?",
-                      font=('Segoe UI', 10)).pack(pady=(20, 10))
+        # Bill summary (texts are filled in per bill)
+        self._receipt_table_lbl = ttk.Label(main_frame, text="",
+                                            font=('Segoe UI', 12))
+        self._receipt_table_lbl.pack(pady=2)
+        self._receipt_total_lbl = ttk.Label(main_frame, text="",
+                                            font=('Segoe UI', 12, 'bold'), foreground='#00ff88')
+        self._receipt_total_lbl.pack(pady=2)
 
-            # Receipt options buttons
-            buttons_frame = ttk.Frame(main_frame)
-            buttons_frame.pack(fill=tk.X, pady=10)
+        ttk.Label(main_frame, text="What would you like to do?",
+                  font=('Segoe UI', 10)).pack(pady=(20, 10))
 
-            # Preview receipt button
-            ttk.Button(buttons_frame, text="👁️ Preview Receipt",
-                       command=lambda: self.preview_and_close(table_data, options_window)).pack(fill=tk.X, pady=2)
+        # Receipt options buttons
+        buttons_frame = ttk.Frame(main_frame)
+        buttons_frame.pack(fill=tk.X, pady=10)
 
-            # Print receipt button
-            ttk.Button(buttons_frame, text="🖨️ Print Receipt",
-                       command=lambda: self.print_and_close(table_data, options_window)).pack(fill=tk.X, pady=2)
+        self._receipt_preview_btn = ttk.Button(buttons_frame, text="👁️ Preview Receipt")
+        self._receipt_preview_btn.pack(fill=tk.X, pady=2)
+        self._receipt_print_btn = ttk.Button(buttons_frame, text="🖨️ Print Receipt")
+        self._receipt_print_btn.pack(fill=tk.X, pady=2)
+        self._receipt_save_btn = ttk.Button(buttons_frame, text="💾 Save Receipt")
+        self._receipt_save_btn.pack(fill=tk.X, pady=2)
 
-            # Save receipt button
-            ttk.Button(buttons_frame, text="💾 Save Receipt",
-                       command=lambda: self.save_and_close(table_data, options_window)).pack(fill=tk.X, pady=2)
+        # Separator
+        ttk.Separator(main_frame, orient='horizontal').pack(fill=tk.X, pady=10)
 
-            # Separator
-            ttk.Separator(main_frame, orient='horizontal').pack(fill=tk.X, pady=10)
+        # Table management options
+        ttk.Label(main_frame, text="Table Management:",
+                  font=('Segoe UI', 10)).pack(pady=(10, 5))
 
-            # Table management options
-            ttk.Label(main_frame, text="Table Management:",
-                      font=('Segoe UI', 10)).pack(pady=(10, 5))
+        table_buttons_frame = ttk.Frame(main_frame)
+        table_buttons_frame.pack(fill=tk.X, pady=5)
 
-            table_buttons_frame = ttk.Frame(main_frame)
-            table_buttons_frame.pack(fill=tk.X, pady=5)
+        # Clear table button
+        ttk.Button(table_buttons_frame, text="🧹 Clear Table for Reuse",
+                   command=lambda: self.clear_and_close(options_window)).pack(side=tk.LEFT, padx=(0, 5))
 
-            # Clear table button
-            ttk.Button(table_buttons_frame, text="🧹 Clear Table for Reuse",
-                       command=lambda: self.clear_and_close(options_window)).pack(side=tk.LEFT, padx=(0, 5))
+        # Keep finalized button
+        ttk.Button(table_buttons_frame, text="📋 Keep as Finalized",
+                   command=lambda: self.keep_and_close(options_window)).pack(side=tk.RIGHT, padx=(5, 0))
 
-            # Keep finalized button
-            ttk.Button(table_buttons_frame, text="📋 Keep as Finalized",
-                       command=lambda: self.keep_and_close(options_window)).pack(side=tk.RIGHT, padx=(5, 0))
+        # Close button
+        ttk.Button(main_frame, text="❌ Close",
+                   command=self._hide_receipt_dialog).pack(pady=(20, 0))
 
-            # Close button
-            ttk.Button(main_frame, text="❌ Close",
-                       command=options_window.destroy).pack(pady=(20, 0))
+        self._receipt_dialog = options_window
+        options_window.withdraw()
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to show receipt options: {e}")
+    def _hide_receipt_dialog(self) -> None:
+        """Hide the reusable receipt options dialog"""
+        self._receipt_dialog.grab_release()
+        self._receipt_dialog.withdraw()
 
     def preview_and_close(self, table_data: dict, options_window: tk.Toplevel) -> None:
         """Preview receipt and close options window"""
-        options_window.destroy()
+        self._hide_receipt_dialog()
         self.receipt_manager.preview_receipt(table_data, self.root)
         # Automatically clear table after preview
         self.clear_selected_table(auto_clear=True)
@@ -1007,19 +1315,25 @@ class MainWindow:
 
     def print_and_close(self, table_data: dict, options_window: tk.Toplevel) -> None:
         """Print receipt and close options window"""
-        options_window.destroy()
-        if self.receipt_manager.print_receipt(table_data, self.root):
-            # Automatically clear table after successful print
-            self.clear_selected_table(auto_clear=True)
-        else:
-            # If print failed, ask user what to do
-            if messagebox.askyesno("Print Failed", "Receipt printing failed!\n\nClear table anyway?"):
+        self._hide_receipt_dialog()
+
+        def after_print(success: bool) -> None:
+            # Called on the Tk thread once the print outcome is known;
+            # the send itself runs on a background thread
+            if success:
+                # Automatically clear table after successful print
                 self.clear_selected_table(auto_clear=True)
-        self.update_table_button_colors()
+            elif messagebox.askyesno("Print Failed", "Receipt printing failed!\n\nClear table anyway?"):
+                # If print failed, ask user what to do
+                self.clear_selected_table(auto_clear=True)
+            self.update_table_button_colors()
+
+        self.receipt_manager.print_receipt(table_data, self.root,
+                                           on_complete=after_print)
 
     def save_and_close(self, table_data: dict, options_window: tk.Toplevel) -> None:
         """Save receipt and close options window"""
-        options_window.destroy()
+        self._hide_receipt_dialog()
         if self.receipt_manager.save_receipt(table_data, self.root):
             # Automatically clear table after successful save
             self.clear_selected_table(auto_clear=True)
@@ -1031,12 +1345,12 @@ class MainWindow:
 
     def clear_and_close(self, options_window: tk.Toplevel) -> None:
         """Clear table and close options window"""
-        options_window.destroy()
+        self._hide_receipt_dialog()
         self.clear_selected_table(auto_clear=True)
 
     def keep_and_close(self, options_window: tk.Toplevel) -> None:
         """Keep table as finalized and close options window"""
-        options_window.destroy()
+        self._hide_receipt_dialog()
         self.update_table_button_colors()
 
     def add_manual_item_to_table(self) -> None:
@@ -1051,25 +1365,19 @@ class MainWindow:
             messagebox.showerror("Error", "Please enter an item name!")
             return
         
-        try:
-            price = float(self.item_price_var.get())
-            if price < 0:
-                raise ValueError("Price cannot be negative")
-        except ValueError:
+        price = _parse_nonneg_float(self.item_price_var.get())
+        if price is None:
             messagebox.showerror("Error", "Please enter a valid price!")
             return
-        
-        try:
-            quantity = int(self.item_quantity_var.get())
-            if quantity <= 0:
-                raise ValueError("Quantity must be positive")
-        except ValueError:
+
+        quantity = _parse_pos_int(self.item_quantity_var.get())
+        if quantity is None:
             messagebox.showerror("Error", "Please enter a valid quantity!")
             return
-        
+
         # Add item to table
         if self.controller.add_item_to_table(self.current_table_name, item_name, price, quantity):
-            self.status_label.config(text=f"🛒 Added {quantity}x {item_name} to {self.current_table_name}")
+            self._set_status(f"🛒 Added {quantity}x {item_name} to {self.current_table_name}")
             self.clear_form()
         else:
             messagebox.showerror("Error", "Failed to add item to table!")
@@ -1085,11 +1393,11 @@ class MainWindow:
             messagebox.showwarning("Warning", "Please select an item to remove!")
             return
         
-        item_index = self.items_tree.index(selection[0])
+        item_index = int(selection[0])
         
         if messagebox.askyesno("Confirm", "Remove this item?"):
             if self.controller.remove_item_from_table(self.current_table_name, item_index):
-                self.status_label.config(text="❌ Item removed")
+                self._set_status("❌ Item removed")
             else:
                 messagebox.showerror("Error", "Failed to remove item!")
     
@@ -1112,10 +1420,10 @@ class MainWindow:
             messagebox.showerror("Error", "Please enter a valid quantity!")
             return
         
-        item_index = self.items_tree.index(selection[0])
+        item_index = int(selection[0])
         
         if self.controller.update_item_quantity(self.current_table_name, item_index, new_quantity):
-            self.status_label.config(text="🔄 Quantity updated")
+            self._set_status("🔄 Quantity updated")
         else:
             messagebox.showerror("Error", "Failed to update quantity!")
     
@@ -1139,6 +1447,7 @@ class MainWindow:
     def refresh_table_details(self) -> None:
         """Refresh the table details display"""
         # Clear existing items first
+        self._row_items.clear()
         for item in self.items_tree.get_children():
             self.items_tree.delete(item)
 
@@ -1158,9 +1467,11 @@ class MainWindow:
         status = "🟢 Active" if table.is_active else "🔴 Finalized"
         self.table_info_label.config(text=f"{self.current_table_name} - {status}")
 
-        # Add items with price column
-        for item in table.items:
-            self.items_tree.insert("", "end", values=(
+        # Add items with price column (iid is the item's position so handlers
+        # can recover the index without an O(n) tree walk)
+        for idx, item in enumerate(table.items):
+            self._row_items[str(idx)] = item
+            self.items_tree.insert("", "end", iid=str(idx), values=(
                 item.name,
                 item.quantity,
                 f"₹{item.price:.2f}",
@@ -1195,19 +1506,30 @@ class MainWindow:
         """Load all product data from JSON files in productData folder"""
         product_data = {}
 
-        # Get the productData folder path
-        current_dir = Path(__file__).parent.parent.parent
-        product_data_dir = current_dir / "productData"
-
-        if not product_data_dir.exists():
-            print(f"Product data directory not found: {product_data_dir}")
+        # Scan the cached productData folder; a missing directory shows up as
+        # FileNotFoundError so we don't need a separate exists() stat call
+        try:
+            with os.scandir(self._product_data_dir) as entries:
+                json_files = []
+                latest_mtime = 0.0
+                for entry in entries:
+                    if entry.name.endswith(".json"):
+                        json_files.append(Path(entry.path))
+                        latest_mtime = max(latest_mtime, entry.stat().st_mtime)
+                json_files.sort()
+        except FileNotFoundError:
+            print(f"Product data directory not found: {self._product_data_dir}")
             return product_data
 
-        # Scan all JSON files in the productData folder
-        for json_file in product_data_dir.glob("*.json"):
+        # The menu rarely changes; reuse the parsed result until a file's
+        # mtime moves
+        with self._product_cache_lock:
+            if self._product_cache is not None and latest_mtime == self._product_cache_mtime:
+                return self._product_cache
+
+        for json_file in json_files:
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = json.loads(json_file.read_bytes())
 
                 # Extract category name from filename
                 category_name = json_file.stem.replace('_', ' ').title()
@@ -1225,8 +1547,18 @@ class MainWindow:
                 print(f"Error loading {json_file}: {e}")
                 continue
 
+        with self._product_cache_lock:
+            self._product_cache = product_data
+            self._product_cache_mtime = latest_mtime
+
         return product_data
 
+    def invalidate_product_cache(self) -> None:
+        """Force the next load_product_data call to re-read the JSON files"""
+        with self._product_cache_lock:
+            self._product_cache = None
+            self._product_cache_mtime = 0.0
+
     def _extract_products_from_data(self, data) -> list:
         """Extract products from various JSON data structures"""
         products = []
@@ -1263,6 +1595,17 @@ class MainWindow:
 
     def _normalize_product(self, product: dict) -> dict:
         """Normalize product data to standard format"""
+        # Fast path for the common schema with all three keys present
+        try:
+            name, display_name, amount = _FAST_PRODUCT_FIELDS(product)
+            return {
+                'name': str(name),
+                'display_name': str(display_name),
+                'amount': float(amount)
+            }
+        except (KeyError, ValueError, TypeError):
+            pass
+
         try:
             # Try to extract name
             name = (product.get('name') or
@@ -1309,41 +1652,35 @@ class MainWindow:
         button_spacing = 10
         row_spacing = 8
 
-        # Create container for all button rows
+        # Create container for all button rows; uniform grid columns are
+        # resolved once instead of re-packing row frames per category
         buttons_container = ttk.Frame(parent_frame)
         buttons_container.pack(fill=tk.X, pady=10)
+        for col in range(buttons_per_row):
+            buttons_container.columnconfigure(col, weight=1, uniform='prod')
 
-        # Create buttons in rows of 5
-        for i in range(0, len(products), buttons_per_row):
-            row_products = products[i:i + buttons_per_row]
+        # Truncation bounds are the same for every button; compute them once
+        max_chars = button_width // (font_size - 2)  # Rough character estimate
+        slice_end = max_chars - 3
 
-            # Create row frame
-            row_frame = ttk.Frame(buttons_container)
-            row_frame.pack(fill=tk.X, pady=row_spacing)
+        for i, product in enumerate(products):
+            # Truncate long names to fit button
+            item_name = product['display_name']
+            display_text = item_name if len(item_name) <= max_chars else item_name[:slice_end] + "..."
 
-            # Create buttons for this row
-            for j, product in enumerate(row_products):
-                # Truncate long names to fit button
-                max_chars = button_width // (font_size - 2)  # Rough character estimate
-                item_name = product['display_name']
-                if len(item_name) > max_chars:
-                    item_name = item_name[:max_chars-3] + "..."
+            # Create button
+            btn = ttk.Button(buttons_container,
+                             text=display_text,
+                             style=style_name,
+                             width=button_width // 8,  # Convert to character width
+                             command=lambda p=product: self.add_product_to_table(p))
 
-                display_text = f"{item_name}"
+            row, col = divmod(i, buttons_per_row)
+            padx = (button_spacing, 0) if col > 0 else (0, 0)
+            btn.grid(row=row, column=col, sticky=tk.EW, padx=padx, pady=(row_spacing, 2))
 
-                # Create button
-                btn = ttk.Button(row_frame,
-                                 text=display_text,
-                                 style=style_name,
-                                 width=button_width // 8,  # Convert to character width
-                                 command=lambda p=product: self.add_product_to_table(p))
-
-                # Pack button with spacing
-                padx = (button_spacing, 0) if j > 0 else (0, 0)
-                btn.pack(side=tk.LEFT, padx=padx, pady=2)
-
-                tooltip_text = f"{product['name']}\nPrice: ₹{product['amount']:.2f}"
-                self._create_tooltip(btn, tooltip_text)
+            self._tooltips[str(btn)] = f"{product['name']}\nPrice: ₹{product['amount']:.2f}"
+            btn.bindtags(btn.bindtags() + ('ProductTip',))
 
     def _optimize_button_layout(self, products: list, available_width: int,
                                 min_width: int, max_width: int, spacing: int) -> list:
@@ -1405,151 +1742,109 @@ class MainWindow:
 
         return rows
 
-    def _truncate_text(self, text: str, max_width: int, font_size: int) -> str:
-        """Truncate text to fit within button width with better calculation"""
-        # Enhanced character width calculation
-        char_width = font_size * 0.65  # Slightly more accurate
-        max_chars = int(max_width / char_width) - 4  # Reserve more space for "..."
-
-        if len(text) <= max_chars:
-            return text
-
-        # Better truncation - try to break at word boundaries
-        if max_chars > 10:  # Only for reasonably sized buttons
-            words = text.split()
-            truncated = ""
-            for word in words:
-                if len(truncated + word + " ") <= max_chars - 3:
-                    truncated += word + " "
-                else:
-                    break
-            if truncated.strip():
-                return truncated.strip() + "..."
-
-        return text[:max_chars] + "..."
-
-    def _create_tooltip(self, widget, text: str) -> None:
-        """Create a simple tooltip for a widget"""
-        def on_enter(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root + 15}+{event.y_root + 10}")
-            tooltip.configure(bg='#2d2d2d')
-
-            label = tk.Label(tooltip, text=text,
-                             bg='#2d2d2d', fg='#ffffff',
-                             font=('Segoe UI', 10),
-                             relief='solid', borderwidth=1,
-                             padx=8, pady=4,
-                             justify=tk.LEFT)
-            label.pack()
-
-            widget.tooltip = tooltip
-
-        def on_leave(event):
-            if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
-                del widget.tooltip
-
-        widget.bind('<Enter>', on_enter)
-        widget.bind('<Leave>', on_leave)
-    
-    def load_and_display_products(self, parent_frame: ttk.Frame) -> None:
-        """Load products from JSON files and create buttons with simple layout"""
-        # Clear existing widgets
-        for widget in parent_frame.winfo_children():
-            widget.destroy()
+    def _show_product_tooltip(self, event) -> None:
+        """Show the shared tooltip for the hovered product button"""
+        text = self._tooltips.get(str(event.widget))
+        if not text:
+            return
 
-        # Load product data
-        product_data = self.load_product_data()
+        if self._tooltip_win is None:
+            self._tooltip_win = tk.Toplevel(self.root)
+            self._tooltip_win.wm_overrideredirect(True)
+            self._tooltip_win.configure(bg='#2d2d2d')
+            self._tooltip_label = tk.Label(self._tooltip_win,
+                                           bg='#2d2d2d', fg='#ffffff',
+                                           font=('Segoe UI', 10),
+                                           relief='solid', borderwidth=1,
+                                           padx=8, pady=4,
+                                           justify=tk.LEFT)
+            self._tooltip_label.pack()
+
+        self._tooltip_label.config(text=text)
+        self._tooltip_win.wm_geometry(f"+{event.x_root + 15}+{event.y_root + 10}")
+        self._tooltip_win.deiconify()
+
+    def _hide_product_tooltip(self, event=None) -> None:
+        """Hide the shared tooltip"""
+        if self._tooltip_win is not None:
+            self._tooltip_win.withdraw()
 
-        if not product_data:
-            # No-data message
-            no_data_frame = ttk.Frame(parent_frame)
-            no_data_frame.pack(expand=True, fill=tk.BOTH)
+    def load_and_display_products(self, parent_frame: ttk.Frame) -> None:
+        """Load products from JSON files and create buttons with simple layout"""
+        self._display_products(parent_frame, self.load_product_data())
+
+    def _async_load_products(self, parent_frame: ttk.Frame) -> None:
+        """Load product data on a worker thread, then render on the Tk thread"""
+        def _do_load():
+            product_data = self.load_product_data()
+            # Widgets may only be touched from the Tk thread
+            self.root.after(0, lambda d=product_data: self._on_products_loaded(parent_frame, d))
+
+        threading.Thread(target=_do_load, daemon=True).start()
+
+    def _on_products_loaded(self, parent_frame: ttk.Frame, product_data: dict) -> None:
+        """Render products delivered by the background loader"""
+        if parent_frame.winfo_exists():
+            self._display_products(parent_frame, product_data)
+
+    def _display_products(self, parent_frame: ttk.Frame, product_data: dict) -> None:
+        """Build the category headers and product buttons for loaded data"""
+        # Freeze geometry propagation so the bulk destroy/create below
+        # coalesces into one layout pass instead of one per widget
+        parent_frame.pack_propagate(False)
+        try:
+            # Clear existing widgets (and their registered tooltip texts)
+            self._tooltips.clear()
+            for widget in parent_frame.winfo_children():
+                widget.destroy()
 
-            ttk.Label(no_data_frame, text="🍽️ No Menu Items Found",
-                      style='Title.TLabel').pack(pady=(50, 10))
-            ttk.Label(no_data_frame, text="Add JSON files to the productData folder\nto display menu items here.",
-                      style='TLabel', justify=tk.CENTER).pack(pady=10)
-            return
+            if not product_data:
+                # No-data message
+                no_data_frame = ttk.Frame(parent_frame)
+                no_data_frame.pack(expand=True, fill=tk.BOTH)
 
-        # Color schemes for categories
-        category_colors = [
-            {'bg': '#0078d4', 'fg': '#ffffff', 'hover_bg': '#1a86d9'},  # Blue
-            {'bg': '#107c10', 'fg': '#ffffff', 'hover_bg': '#128a12'},  # Green
-            {'bg': '#d13438', 'fg': '#ffffff', 'hover_bg': '#dc4144'},  # Red
-            {'bg': '#ff8c00', 'fg': '#ffffff', 'hover_bg': '#ff9a1a'},  # Orange
-            {'bg': '#5c2d91', 'fg': '#ffffff', 'hover_bg': '#6b3aa0'},  # Purple
-            {'bg': '#00bcf2', 'fg': '#ffffff', 'hover_bg': '#1ac6f7'},  # Cyan
-            {'bg': '#ca5010', 'fg': '#ffffff', 'hover_bg': '#d45a1a'},  # Brown
-            {'bg': '#8764b8', 'fg': '#ffffff', 'hover_bg': '#9674c7'},  # Lavender
-        ]
-
-        category_index = 0
-
-        for category, products in product_data.items():
-            # Get color scheme for this category
-            color_scheme = category_colors[category_index % len(category_colors)]
-            category_index += 1
-
-            # Create custom style for this category
-            style_name = f'Category{category_index}.TButton'
-            style = ttk.Style()
+                ttk.Label(no_data_frame, text="🍽️ No Menu Items Found",
+                          style='Title.TLabel').pack(pady=(50, 10))
+                ttk.Label(no_data_frame, text="Add JSON files to the productData folder\nto display menu items here.",
+                          style='TLabel', justify=tk.CENTER).pack(pady=10)
+                return
 
-            # Get screen-appropriate font size - INCREASED FONT SIZES
-            screen_width = self.root.winfo_screenwidth()
-            if screen_width >= 1920:
-                font_size = 15          # Increased from 11
-                header_font_size = 14
-            elif screen_width >= 1366:
-                font_size = 15          # Increased from 10
-                header_font_size = 12
-            else:
-                font_size = 15          # Increased from 9
-                header_font_size = 11
-    
-            # Button styling with larger fonts
-            style.configure(style_name,
-                            background=color_scheme['bg'],
-                            foreground=color_scheme['fg'],
-                            font=('Segoe UI', font_size, 'bold'),  # Using increased font size
-                            relief='flat',
-                            borderwidth=2,
-                            padding=(10, 6),
-                            focuscolor='none')
+            category_index = 0
 
-            style.map(style_name,
-                      background=[('active', color_scheme['hover_bg']),
-                                  ('pressed', color_scheme['bg'])],
-                      relief=[('pressed', 'sunken')])
+            for category, products in product_data.items():
+                # Reuse the styles precomputed in _init_category_styles
+                style_name = self._category_styles[category_index % len(self._category_styles)]
+                category_index += 1
 
-            # Category header
-            header_frame = ttk.Frame(parent_frame)
-            header_frame.pack(fill=tk.X, pady=(20, 8))
+                # Category header
+                header_frame = ttk.Frame(parent_frame)
+                header_frame.pack(fill=tk.X, pady=(20, 8))
 
-            # Header label
-            header_label = ttk.Label(header_frame,
-                                     text=f"🏷️ {category} ({len(products)} items)",
-                                     font=('Segoe UI', header_font_size, 'bold'),
-                                     foreground='#00d4ff')
-            header_label.pack(side=tk.LEFT)
+                # Header label
+                header_label = ttk.Label(header_frame,
+                                         text=f"🏷️ {category} ({len(products)} items)",
+                                         font=('Segoe UI', self._header_font_size, 'bold'),
+                                         foreground='#00d4ff')
+                header_label.pack(side=tk.LEFT)
 
-            # Separator line
-            separator = ttk.Separator(parent_frame, orient='horizontal')
-            separator.pack(fill=tk.X, pady=(5, 10))
+                # Separator line
+                separator = ttk.Separator(parent_frame, orient='horizontal')
+                separator.pack(fill=tk.X, pady=(5, 10))
 
-            # Product buttons frame
-            buttons_frame = ttk.Frame(parent_frame)
-            buttons_frame.pack(fill=tk.X, pady=(0, 15))
+                # Product buttons frame
+                buttons_frame = ttk.Frame(parent_frame)
+                buttons_frame.pack(fill=tk.X, pady=(0, 15))
 
-            # Create buttons for products in this category
-            self._create_product_buttons(buttons_frame, products, style_name)
+                # Create buttons for products in this category
+                self._create_product_buttons(buttons_frame, products, style_name)
+        finally:
+            parent_frame.pack_propagate(True)
+            # One deferred flush once Tk is idle, instead of per category
+            parent_frame.after_idle(parent_frame.update_idletasks)
 
     def _is_valid_product(self, product) -> bool:
         """Check if product has required fields"""
-        return (isinstance(product, dict) and
-                all(key in product for key in ['name', 'display_name', 'amount']))
+        return isinstance(product, dict) and product.keys() >= _REQUIRED_PRODUCT_KEYS
 
     def add_product_to_table(self, product: dict) -> None:
         """Add a product from the menu to the current table"""
@@ -1564,7 +1859,7 @@ class MainWindow:
 
             # Add item to table
             if self.controller.add_item_to_table(self.current_table_name, item_name, price, quantity):
-                self.status_label.config(text=f"🛒 Added {item_name} to {self.current_table_name}")
+                self._set_status(f"🛒 Added {item_name} to {self.current_table_name}")
             else:
                 messagebox.showerror("Error", "Failed to add item to table!")
 
@@ -1573,16 +1868,10 @@ class MainWindow:
 
     def refresh_product_display(self) -> None:
         """Refresh the product display"""
-        # Find the scrollable frame and reload products
-        for widget in self.root.winfo_children():
-            if isinstance(widget, ttk.Frame):
-                for child in widget.winfo_children():
-                    if isinstance(child, ttk.LabelFrame) and "Menu Items" in child.cget("text"):
-                        for canvas_widget in child.winfo_children():
-                            if isinstance(canvas_widget, tk.Canvas):
-                                scrollable_frame = canvas_widget.nametowidget(canvas_widget.find_all()[0])
-                                self.load_and_display_products(scrollable_frame)
-                                return
+        frame = getattr(self, '_product_scrollable_frame', None)
+        if frame is not None and frame.winfo_exists():
+            self.load_and_display_products(frame)
+            return
 
         # Fallback: refresh all data
         self.refresh_all_data()
@@ -1630,13 +1919,13 @@ class MainWindow:
 
     def refresh_sales_display(self, parent_window) -> None:
         """Refresh the sales display"""
-        if hasattr(self, 'sales_display_frame') and self.sales_display_frame.winfo_exists():
+        frame = getattr(self, 'sales_display_frame', None)
+        if frame is not None and frame.winfo_exists():
             self.show_daily_sales_report(parent_window)
 
     def show_daily_sales_report(self, parent_window=None) -> None:
         """Show today's sales summary"""
         try:
-            from datetime import datetime
 
             # If no parent window provided, create a new window
             if parent_window is None:
@@ -1657,11 +1946,9 @@ class MainWindow:
                 display_frame = ttk.Frame(main_frame)
                 display_frame.pack(fill=tk.BOTH, expand=True)
             else:
-                # Use existing sales display frame
+                # Use existing sales display frame; its persistent
+                # report widgets are reused, not torn down
                 display_frame = self.sales_display_frame
-                # Clear display frame
-                for widget in display_frame.winfo_children():
-                    widget.destroy()
 
             # Get today's date
             today = datetime.now().strftime("%Y-%m-%d")
@@ -1683,15 +1970,14 @@ class MainWindow:
                           style='TLabel').pack(pady=20)
             else:
                 # Use existing display frame if it exists
-                if hasattr(self, 'sales_display_frame') and self.sales_display_frame.winfo_exists():
-                    ttk.Label(self.sales_display_frame, text=f"Error loading daily sales: {e}",
+                frame = getattr(self, 'sales_display_frame', None)
+                if frame is not None and frame.winfo_exists():
+                    ttk.Label(frame, text=f"Error loading daily sales: {e}",
                               style='TLabel').pack(pady=20)
 
     def show_date_picker(self, parent_window) -> None:
         """Show date picker for sales reports"""
         try:
-            from datetime import datetime
-            import tkinter.simpledialog as simpledialog
 
             # Simple date input dialog
             date_str = simpledialog.askstring("Select Date",
@@ -1702,8 +1988,9 @@ class MainWindow:
                 try:
                     # Validate date format
                     datetime.strptime(date_str, "%Y-%m-%d")
-                    if hasattr(self, 'sales_display_frame') and self.sales_display_frame.winfo_exists():
-                        self.show_sales_for_date_in_frame(date_str, self.sales_display_frame)
+                    frame = getattr(self, 'sales_display_frame', None)
+                    if frame is not None and frame.winfo_exists():
+                        self.show_sales_for_date_in_frame(date_str, frame)
                 except ValueError:
                     messagebox.showerror("Invalid Date", "Please enter date in YYYY-MM-DD format")
 
@@ -1712,131 +1999,199 @@ class MainWindow:
 
     def show_sales_for_date(self, date_str: str) -> None:
         """Show sales data for a specific date"""
-        if hasattr(self, 'sales_display_frame') and self.sales_display_frame.winfo_exists():
-            self.show_sales_for_date_in_frame(date_str, self.sales_display_frame)
+        frame = getattr(self, 'sales_display_frame', None)
+        if frame is not None and frame.winfo_exists():
+            self.show_sales_for_date_in_frame(date_str, frame)
 
     def show_sales_for_date_in_frame(self, date_str: str, display_frame: ttk.Frame) -> None:
         """Show sales data for a specific date in the given frame"""
         try:
-            # Clear display frame
-            for widget in display_frame.winfo_children():
-                widget.destroy()
-
-            # Load daily sales data
-            current_dir = Path(__file__).parent.parent.parent
-            data_dir = current_dir / "data"
-            daily_file = data_dir / f"daily_sales_{date_str}.json"
-
-            if not daily_file.exists():
-                ttk.Label(display_frame, text=f"No sales data found for {date_str}",
-                          style='TLabel').pack(pady=20)
-                return
-
-            with open(daily_file, 'r', encoding='utf-8') as f:
-                daily_data = json.load(f)
-
-            # Create notebook for different views
-            notebook = ttk.Notebook(display_frame)
-            notebook.pack(fill=tk.BOTH, expand=True, pady=10)
-
-            # Summary tab
-            summary_frame = ttk.Frame(notebook)
-            notebook.add(summary_frame, text="📊 Summary")
-
-            summary_text = f"""
-    📅 Date: {daily_data['date']}
-    💰 Total Sales: ₹{daily_data['total_sales']:.2f}
-    📋 Total Orders: {daily_data['total_orders']}
-            """
-
-            ttk.Label(summary_frame, text=summary_text,
-                      style='TLabel', justify=tk.LEFT).pack(pady=20)
-
-            # Items sold section
-            if daily_data.get('items_sold'):
-                items_label_frame = ttk.LabelFrame(summary_frame, text="🍽️ Items Sold", padding="10")
-                items_label_frame.pack(fill=tk.X, pady=10, padx=20)
-
-                # Create treeview for items
-                items_columns = ("Item", "Quantity")
-                items_tree = ttk.Treeview(items_label_frame, columns=items_columns, show="headings", height=8)
-
-                for col in items_columns:
-                    items_tree.heading(col, text=col)
-                    items_tree.column(col, width=200)
-
-                for item, qty in daily_data['items_sold'].items():
-                    items_tree.insert("", "end", values=(item, qty))
-
-                items_tree.pack(fill=tk.X, pady=5)
-
-            # Hourly breakdown section
-            if daily_data.get('hourly_breakdown'):
-                hourly_label_frame = ttk.LabelFrame(summary_frame, text="⏰ Hourly Sales", padding="10")
-                hourly_label_frame.pack(fill=tk.X, pady=10, padx=20)
-
-                hourly_columns = ("Hour", "Sales")
-                hourly_tree = ttk.Treeview(hourly_label_frame, columns=hourly_columns, show="headings", height=6)
-
-                for col in hourly_columns:
-                    hourly_tree.heading(col, text=col)
-                    hourly_tree.column(col, width=150)
+            state = getattr(self, '_report_state', None)
+            if (state is None or state['frame'] is not display_frame
+                    or not state['notebook'].winfo_exists()):
+                self._build_report_widgets(display_frame)
+            self._load_sales_into_trees(date_str)
+        except Exception as e:
+            ttk.Label(display_frame, text=f"Error loading sales data: {e}",
+                      style='TLabel').pack(pady=20)
 
-                for hour, sales in sorted(daily_data['hourly_breakdown'].items()):
-                    hourly_tree.insert("", "end", values=(hour, f"₹{sales:.2f}"))
+    def _build_report_widgets(self, display_frame: ttk.Frame) -> None:
+        """Create the report notebook and trees once per display frame.
 
-                hourly_tree.pack(fill=tk.X, pady=5)
+        Flipping through dates afterwards only clears and refills the
+        tree rows; the notebook, label frames and treeviews themselves
+        are never rebuilt. Tabs stay lazy: a tab is filled on first
+        selection after each date change.
+        """
+        for widget in display_frame.winfo_children():
+            widget.destroy()
 
-            # Detailed orders tab with removal functionality
-            if daily_data.get('orders'):
-                orders_frame = ttk.Frame(notebook)
-                notebook.add(orders_frame, text="📋 Detailed Orders")
+        no_data_label = ttk.Label(display_frame, text="", style='TLabel')
+
+        notebook = ttk.Notebook(display_frame)
+
+        # Summary tab
+        summary_frame = ttk.Frame(notebook)
+        notebook.add(summary_frame, text="📊 Summary")
+
+        summary_label = ttk.Label(summary_frame, text="", style='TLabel', justify=tk.LEFT)
+        summary_label.pack(pady=20)
+
+        items_label_frame = ttk.LabelFrame(summary_frame, text="🍽️ Items Sold", padding="10")
+        items_columns = ("Item", "Quantity")
+        items_tree = ttk.Treeview(items_label_frame, columns=items_columns, show="headings", height=8)
+        for col in items_columns:
+            items_tree.heading(col, text=col)
+            items_tree.column(col, width=200)
+        items_tree.pack(fill=tk.X, pady=5)
+
+        hourly_label_frame = ttk.LabelFrame(summary_frame, text="⏰ Hourly Sales", padding="10")
+        hourly_columns = ("Hour", "Sales")
+        hourly_tree = ttk.Treeview(hourly_label_frame, columns=hourly_columns, show="headings", height=6)
+        for col in hourly_columns:
+            hourly_tree.heading(col, text=col)
+            hourly_tree.column(col, width=150)
+        hourly_tree.pack(fill=tk.X, pady=5)
+
+        # Detailed orders tab with removal functionality
+        orders_frame = ttk.Frame(notebook)
+        notebook.add(orders_frame, text="📋 Detailed Orders")
+
+        controls_frame = ttk.Frame(orders_frame)
+        controls_frame.pack(fill=tk.X, pady=(0, 10))
+
+        ttk.Button(controls_frame, text="🗑️ Remove Selected Order",
+                   style='Danger.TButton',
+                   command=lambda: self.remove_sale_order(
+                       self._report_state['date_str'], orders_tree, display_frame)).pack(side=tk.LEFT, padx=(0, 10))
+
+        ttk.Button(controls_frame, text="🔄 Refresh",
+                   style='Primary.TButton',
+                   command=lambda: self.show_sales_for_date_in_frame(
+                       self._report_state['date_str'], display_frame)).pack(side=tk.LEFT)
+
+        orders_columns = ("Time", "Table", "Items", "Total")
+        orders_tree = ttk.Treeview(orders_frame, columns=orders_columns, show="headings", height=20)
+
+        column_widths = {"Time": 150, "Table": 100, "Items": 80, "Total": 100}
+        for col in orders_columns:
+            orders_tree.heading(col, text=col)
+            orders_tree.column(col, width=column_widths[col])
+        _configure_row_tags(orders_tree)
+
+        orders_tree.pack(fill=tk.BOTH, expand=True, pady=10)
+
+        orders_scrollbar = ttk.Scrollbar(orders_frame, orient=tk.VERTICAL, command=orders_tree.yview)
+        orders_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        orders_tree.configure(yscrollcommand=orders_scrollbar.set)
+
+        self._report_state = {
+            'frame': display_frame,
+            'notebook': notebook,
+            'no_data_label': no_data_label,
+            'summary_label': summary_label,
+            'items_label_frame': items_label_frame,
+            'items_tree': items_tree,
+            'hourly_label_frame': hourly_label_frame,
+            'hourly_tree': hourly_tree,
+            'orders_tree': orders_tree,
+            'tabs': {str(summary_frame): 'summary', str(orders_frame): 'orders'},
+            'populated': set(),
+            'date_str': None,
+            'daily_data': None,
+        }
+
+        notebook.bind('<<NotebookTabChanged>>',
+                      lambda e: self._populate_selected_report_tab())
+
+    def _load_sales_into_trees(self, date_str: str) -> None:
+        """Point the persistent report widgets at a new date's data"""
+        state = self._report_state
+        state['date_str'] = date_str
+
+        daily_file = _daily_file(date_str)
+        if not daily_file.exists():
+            state['notebook'].pack_forget()
+            state['no_data_label'].config(text=f"No sales data found for {date_str}")
+            state['no_data_label'].pack(pady=20)
+            state['daily_data'] = None
+            return
 
-                # Control buttons frame
-                controls_frame = ttk.Frame(orders_frame)
-                controls_frame.pack(fill=tk.X, pady=(0, 10))
+        state['no_data_label'].pack_forget()
+        if not state['notebook'].winfo_manager():
+            state['notebook'].pack(fill=tk.BOTH, expand=True, pady=10)
 
-                ttk.Button(controls_frame, text="🗑️ Remove Selected Order",
-                           style='Danger.TButton',
-                           command=lambda: self.remove_sale_order(date_str, orders_tree, display_frame)).pack(side=tk.LEFT, padx=(0, 10))
+        state['daily_data'] = _loads(daily_file.read_bytes())
+        state['populated'] = set()
+        self._populate_selected_report_tab()
 
-                ttk.Button(controls_frame, text="🔄 Refresh",
-                           style='Primary.TButton',
-                           command=lambda: self.show_sales_for_date_in_frame(date_str, display_frame)).pack(side=tk.LEFT)
+    def _populate_selected_report_tab(self) -> None:
+        """Fill the currently selected report tab once per loaded date"""
+        state = getattr(self, '_report_state', None)
+        if not state or state['daily_data'] is None:
+            return
 
-                # Create treeview for orders
-                orders_columns = ("Time", "Table", "Items", "Total", "Order ID")
-                orders_tree = ttk.Treeview(orders_frame, columns=orders_columns, show="headings", height=20)
+        tab = state['tabs'].get(state['notebook'].select())
+        if tab is None or tab in state['populated']:
+            return
+        state['populated'].add(tab)
 
-                column_widths = {"Time": 150, "Table": 100, "Items": 80, "Total": 100, "Order ID": 0}
-                for col in orders_columns:
-                    orders_tree.heading(col, text=col)
-                    if col == "Order ID":
-                        orders_tree.column(col, width=0, minwidth=0)  # Hidden column for order index
-                    else:
-                        orders_tree.column(col, width=column_widths[col])
-
-                # Add orders data with index for identification
-                for index, order in enumerate(daily_data['orders']):
-                    time_str = order['finalized_at'][11:19]  # Extract time part
-                    orders_tree.insert("", "end", values=(
-                        time_str,
-                        order['table_name'],
-                        order['items_count'],
-                        f"₹{order['total_amount']:.2f}",
-                        index  # Hidden order index
-                    ))
-
-                orders_tree.pack(fill=tk.BOTH, expand=True, pady=10)
-
-                # Add scrollbar for orders
-                orders_scrollbar = ttk.Scrollbar(orders_frame, orient=tk.VERTICAL, command=orders_tree.yview)
-                orders_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-                orders_tree.configure(yscrollcommand=orders_scrollbar.set)
+        if tab == 'summary':
+            self._populate_summary_tab(state)
+        else:
+            self._populate_orders_tab(state)
 
-        except Exception as e:
-            ttk.Label(display_frame, text=f"Error loading sales data: {e}",
-                      style='TLabel').pack(pady=20)
+    def _populate_summary_tab(self, state: dict) -> None:
+        """Refill the summary tab (totals, items sold, hourly sales)"""
+        daily_data = state['daily_data']
+        state['summary_label'].config(text=f"""
+    📅 Date: {daily_data['date']}
+    💰 Total Sales: ₹{daily_data['total_sales']:.2f}
+    📋 Total Orders: {daily_data['total_orders']}
+        """)
+
+        # Items sold section
+        items_tree = state['items_tree']
+        items_tree.delete(*items_tree.get_children())
+        if daily_data.get('items_sold'):
+            if not state['items_label_frame'].winfo_manager():
+                state['items_label_frame'].pack(fill=tk.X, pady=10, padx=20)
+            _bulk_insert(items_tree, [(None, (item, qty))
+                                      for item, qty in daily_data['items_sold'].items()])
+        else:
+            state['items_label_frame'].pack_forget()
+
+        # Hourly breakdown section
+        hourly_tree = state['hourly_tree']
+        hourly_tree.delete(*hourly_tree.get_children())
+        if daily_data.get('hourly_breakdown'):
+            if not state['hourly_label_frame'].winfo_manager():
+                state['hourly_label_frame'].pack(fill=tk.X, pady=10, padx=20)
+            # Hours are zero-padded, so lexical order is chronological
+            hourly_rows = sorted(daily_data['hourly_breakdown'].items(),
+                                 key=operator.itemgetter(0))
+            _bulk_insert(hourly_tree, [(None, (hour, f"₹{sales:.2f}"))
+                                       for hour, sales in hourly_rows])
+        else:
+            state['hourly_label_frame'].pack_forget()
+
+    def _populate_orders_tab(self, state: dict) -> None:
+        """Refill the detailed-orders tree for the loaded date"""
+        daily_data = state['daily_data']
+        orders_tree = state['orders_tree']
+        orders_tree.delete(*orders_tree.get_children())
+
+        # Rows are keyed by the stable order_id (index for legacy
+        # records written before ids existed)
+        _bulk_insert(orders_tree, [
+            (order.get('order_id', str(index)), (
+                order.get('time_str') or order['finalized_at'][11:19],
+                order['table_name'],
+                order['items_count'],
+                f"₹{order['total_amount']:.2f}"
+            ), _ROW_TAGS[index % 2])
+            for index, order in enumerate(daily_data['orders'])
+        ])
 
     def remove_sale_order(self, date_str: str, orders_tree: ttk.Treeview, display_frame: ttk.Frame) -> None:
         """Remove a selected sale order with password protection"""
@@ -1848,14 +2203,14 @@ class MainWindow:
                 return
 
             # Get selected order details
-            item_values = orders_tree.item(selection[0], "values")
-            if not item_values or len(item_values) < 5:
+            order_iid = selection[0]
+            item_values = orders_tree.item(order_iid, "values")
+            if not item_values or len(item_values) < 4:
                 messagebox.showerror("Error", "Invalid order selection!")
                 return
 
-            order_index = int(item_values[4])  # Hidden order index
             table_name = item_values[1]
-            total_amount = item_values[3].replace('₹', '')
+            total_amount = item_values[3].translate(_CURRENCY_STRIP)
             time_str = item_values[0]
 
             # Show password dialog
@@ -1873,46 +2228,27 @@ class MainWindow:
                 return
 
             # Load and modify daily sales data
-            current_dir = Path(__file__).parent.parent.parent
-            data_dir = current_dir / "data"
-            daily_file = data_dir / f"daily_sales_{date_str}.json"
-
-            with open(daily_file, 'r', encoding='utf-8') as f:
-                daily_data = json.load(f)
-
-            # Get the order to remove
-            if order_index >= len(daily_data['orders']):
+            daily_file = _daily_file(date_str)
+            daily_data = _loads(daily_file.read_bytes())
+
+            # Locate the order by its id (falling back to the positional
+            # iid used for legacy records without one)
+            id_to_index = {order.get('order_id', str(index)): index
+                           for index, order in enumerate(daily_data['orders'])}
+            order_index = id_to_index.get(order_iid)
+            if order_index is None:
                 messagebox.showerror("Error", "Order not found!")
                 return
 
             removed_order = daily_data['orders'][order_index]
 
-            # Update totals
-            daily_data['total_sales'] -= removed_order['total_amount']
-            daily_data['total_orders'] -= 1
-
-            # Update items sold count
-            for item in removed_order['items']:
-                item_name = item['name']
-                if item_name in daily_data['items_sold']:
-                    daily_data['items_sold'][item_name] -= item['quantity']
-                    if daily_data['items_sold'][item_name] <= 0:
-                        del daily_data['items_sold'][item_name]
-
-            # Update hourly breakdown
-            from datetime import datetime
-            hour = datetime.fromisoformat(removed_order['finalized_at']).strftime("%H:00")
-            if hour in daily_data['hourly_breakdown']:
-                daily_data['hourly_breakdown'][hour] -= removed_order['total_amount']
-                if daily_data['hourly_breakdown'][hour] <= 0:
-                    del daily_data['hourly_breakdown'][hour]
-
-            # Remove the order
+            # Remove the order and rebuild the aggregates from what
+            # remains instead of patching them with deltas
             daily_data['orders'].pop(order_index)
+            self._recompute_daily_aggregates(daily_data)
 
             # Save updated data
-            with open(daily_file, 'w', encoding='utf-8') as f:
-                json.dump(daily_data, f, indent=2, ensure_ascii=False)
+            daily_file.write_bytes(_dumps(daily_data))
 
             # Log the removal for audit trail
             self.log_order_removal(date_str, removed_order)
@@ -1926,9 +2262,30 @@ class MainWindow:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to remove order: {e}")
 
+    def _recompute_daily_aggregates(self, daily_data: dict) -> None:
+        """Rebuild totals, items_sold and hourly_breakdown from the orders list.
+
+        A single pass over the remaining orders avoids the floating-point
+        drift of subtracting deltas on every removal, and works unchanged
+        if several orders are popped before one save.
+        """
+        orders = daily_data['orders']
+        daily_data['total_sales'] = round(sum(order['total_amount'] for order in orders), 2)
+        daily_data['total_orders'] = len(orders)
+
+        items_sold = Counter()
+        hourly = defaultdict(float)
+        for order in orders:
+            for item in order['items']:
+                items_sold[item['name']] += item['quantity']
+            hour = order.get('hour_bucket') or order['finalized_at'][11:13] + ":00"
+            hourly[hour] += order['total_amount']
+
+        daily_data['items_sold'] = dict(items_sold)
+        daily_data['hourly_breakdown'] = {hour: round(sales, 2) for hour, sales in hourly.items()}
+
     def verify_admin_password(self) -> bool:
         """Verify admin password for sensitive operations"""
-        import tkinter.simpledialog as simpledialog
 
         # Create custom password dialog
         password_window = tk.Toplevel(self.root)
@@ -1964,7 +2321,7 @@ class MainWindow:
 
         def check_password():
             entered_password = password_var.get()
-            if entered_password == "H@rsh123":
+            if _verify_admin_hash(entered_password):
                 result['authenticated'] = True
                 password_window.destroy()
             else:
@@ -1995,22 +2352,11 @@ class MainWindow:
     def log_order_removal(self, date_str: str, removed_order: dict) -> None:
         """Log order removal for audit trail"""
         try:
-            from datetime import datetime
-
-            # Get the data directory path
-            current_dir = Path(__file__).parent.parent.parent
-            data_dir = current_dir / "data"
-            data_dir.mkdir(exist_ok=True)
 
-            # Create audit log file
-            audit_file = data_dir / "order_removals_audit.json"
+            DATA_DIR.mkdir(exist_ok=True)
 
-            # Load existing audit data or create new
-            if audit_file.exists():
-                with open(audit_file, 'r', encoding='utf-8') as f:
-                    audit_data = json.load(f)
-            else:
-                audit_data = {"removals": []}
+            # Fold any pre-JSONL log into the append-only file first
+            self._migrate_legacy_audit_log()
 
             # Create audit entry
             audit_entry = {
@@ -2020,17 +2366,37 @@ class MainWindow:
                 "reason": "Manual removal via admin interface"
             }
 
-            # Add to audit log
-            audit_data["removals"].append(audit_entry)
-
-            # Save audit log
-            with open(audit_file, 'w', encoding='utf-8') as f:
-                json.dump(audit_data, f, indent=2, ensure_ascii=False)
+            # Append one JSON line; the log file is never rewritten
+            with open(AUDIT_FILE, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(audit_entry, ensure_ascii=False) + '\n')
 
         except Exception as e:
             print(f"Error logging order removal: {e}")
             # Don't show error to user as this is background operation
 
+    def _migrate_legacy_audit_log(self) -> None:
+        """Convert the old whole-file JSON audit log to JSON Lines once.
+
+        The legacy format re-serialized the full history on every
+        removal; its entries are streamed into the .jsonl file and the
+        old file is kept as a .bak alongside it.
+        """
+        legacy_file = DATA_DIR / "order_removals_audit.json"
+        if not legacy_file.exists():
+            return
+
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                legacy_data = json.load(f)
+
+            with open(AUDIT_FILE, 'a', encoding='utf-8') as f:
+                for entry in legacy_data.get("removals", []):
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+            legacy_file.rename(legacy_file.with_suffix('.json.bak'))
+        except Exception as e:
+            print(f"Error migrating audit log: {e}")
+
     def view_removal_audit_log(self) -> None:
         """View the audit log of removed orders"""
         try:
@@ -2049,17 +2415,17 @@ class MainWindow:
                       style='Title.TLabel').pack(pady=(0, 20))
 
             # Load audit data
-            current_dir = Path(__file__).parent.parent.parent
-            data_dir = current_dir / "data"
-            audit_file = data_dir / "order_removals_audit.json"
+            self._migrate_legacy_audit_log()
 
-            if not audit_file.exists():
+            if not AUDIT_FILE.exists():
                 ttk.Label(main_frame, text="No removal history found.",
                           style='TLabel').pack(pady=20)
                 return
 
-            with open(audit_file, 'r', encoding='utf-8') as f:
-                audit_data = json.load(f)
+            # Keep only the most recent window of the log in memory; the
+            # viewer never needs years of history at once
+            with open(AUDIT_FILE, 'r', encoding='utf-8') as f:
+                recent_lines = deque(f, maxlen=1000)
 
             # Create treeview for audit entries
             columns = ("Removal Time", "Original Date", "Table", "Amount", "Items")
@@ -2069,20 +2435,23 @@ class MainWindow:
             for col in columns:
                 audit_tree.heading(col, text=col)
                 audit_tree.column(col, width=column_widths[col])
-
-            # Add audit entries
-            for entry in reversed(audit_data.get("removals", [])):  # Most recent first
-                removal_time = entry['removal_timestamp'][:19].replace('T', ' ')
-                original_date = entry['original_date']
+            _configure_row_tags(audit_tree)
+
+            # Add audit entries, most recent first, parsed lazily per line
+            audit_rows = []
+            for index, line in enumerate(reversed(recent_lines)):
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
                 removed_order = entry['removed_order']
-
-                audit_tree.insert("", "end", values=(
-                    removal_time,
-                    original_date,
+                audit_rows.append((None, (
+                    entry['removal_timestamp'][:19].replace('T', ' '),
+                    entry['original_date'],
                     removed_order['table_name'],
                     f"₹{removed_order['total_amount']:.2f}",
                     removed_order['items_count']
-                ))
+                ), _ROW_TAGS[index % 2]))
+            _bulk_insert(audit_tree, audit_rows)
 
             audit_tree.pack(fill=tk.BOTH, expand=True, pady=10)
 